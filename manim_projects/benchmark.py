@@ -0,0 +1,262 @@
+"""Benchmark scene renders and compare them against a saved baseline.
+
+Every scene, plus stress variants with heavier parameters, renders at
+``-ql`` in a process of its own, so peak RSS belongs to that scene alone.
+Caching is off and the Tex directory starts empty, so every run does the
+same work: each LaTeX expression is compiled and each frame encoded.  Per
+benchmark this records wall time, frames and frames per second, peak RSS,
+LaTeX compiles and the time spent in the video encoder::
+
+    python benchmark.py                         # everything -> media/benchmark/results.json
+    python benchmark.py Testing TestingFineStrips --repeat 3
+    python benchmark.py --save-baseline
+    python benchmark.py --threshold wall_seconds=1.2 --threshold latex_compiles=1
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from build import MEDIA_DIR, PROJECT_DIR, find_scene, find_scenes, load_scene_class
+
+BENCHMARK_DIR = MEDIA_DIR / "benchmark"
+RESULTS_FILE = BENCHMARK_DIR / "results.json"
+BASELINE_FILE = PROJECT_DIR / "benchmark_baseline.json"
+
+# Stress variants: {name: (scene, class attributes overridden)}.
+STRESS = {
+    "TestingFineStrips": ("Testing", {"dx": 0.005}),
+    "RevolveSurfaceDense": ("RevolveSurface", {"resolution": (100, 100)}),
+}
+
+# Largest accepted ratio of current to baseline, the worse way round for each metric.
+THRESHOLDS = {
+    "wall_seconds": 1.10,
+    "fps": 1.10,
+    "peak_rss_mib": 1.10,
+    "latex_compiles": 1.0,
+    "encoder_seconds": 1.15,
+}
+HIGHER_IS_BETTER = {"fps"}
+
+
+def benchmarks(names=None, stress=True):
+    """``{benchmark name: (scene name, attributes)}`` of the selected benchmarks."""
+    selected = {scene.name: (scene.name, {}) for scene in find_scenes()}
+    if stress:
+        selected.update(STRESS)
+    if names:
+        unknown = set(names) - set(selected)
+        if unknown:
+            raise KeyError(f"no benchmark named {', '.join(sorted(unknown))}")
+        selected = {name: selected[name] for name in names}
+    return selected
+
+
+def _peak_rss_mib():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def measure(benchmark, scene_name, attributes):
+    """Render one benchmark in this process and return its metrics."""
+    from manim import tempconfig
+    from manim.utils import tex_file_writing
+
+    from holds import enable_static_holds
+
+    work_dir = BENCHMARK_DIR / "media" / benchmark
+    shutil.rmtree(work_dir, ignore_errors=True)
+    scene = find_scene(scene_name)
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(work_dir),
+        "quality": "low_quality",
+        "disable_caching": True,
+    }
+    counts = {"latex_compiles": 0, "frames": 0, "encoder_seconds": 0.0}
+    lock = threading.Lock()
+
+    def timed(method):
+        # Segment encoders run on their own threads, several at once.
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                with lock:
+                    counts["encoder_seconds"] += time.perf_counter() - start
+
+        return wrapper
+
+    compile_tex = tex_file_writing.compile_tex
+
+    def counting_compile_tex(*args, **kwargs):
+        counts["latex_compiles"] += 1
+        return compile_tex(*args, **kwargs)
+
+    tex_file_writing.compile_tex = counting_compile_tex
+    with tempconfig(options):
+        scene_class = load_scene_class(scene)
+        if attributes:
+            scene_class = type(benchmark, (scene_class,), attributes)
+        started = time.perf_counter()
+        instance = enable_static_holds(scene_class())
+        writer = instance.renderer.file_writer
+        create_segment_encoder = writer._create_segment_encoder
+        write_frame = writer.write_frame
+
+        def create_timed_encoder(target):
+            encoder = create_segment_encoder(target)
+            encoder.write_frame = timed(encoder.write_frame)
+            encoder.finish = timed(encoder.finish)
+            return encoder
+
+        def count_frame(pixels, *, repeat=1):
+            counts["frames"] += repeat
+            return write_frame(pixels, repeat=repeat)
+
+        writer._create_segment_encoder = create_timed_encoder
+        writer.write_frame = count_frame
+        writer.combine_to_movie = timed(writer.combine_to_movie)
+        instance.render()
+        wall = time.perf_counter() - started
+    tex_file_writing.compile_tex = compile_tex
+
+    return {
+        "wall_seconds": wall,
+        "frames": counts["frames"],
+        "fps": counts["frames"] / wall,
+        "peak_rss_mib": _peak_rss_mib(),
+        "latex_compiles": counts["latex_compiles"],
+        "encoder_seconds": counts["encoder_seconds"],
+    }
+
+
+def run_benchmark(benchmark, scene_name, attributes, repeat=1):
+    """Measure ``benchmark`` ``repeat`` times, each in a fresh process; metrics are medians."""
+    output = BENCHMARK_DIR / f"{benchmark}.run.json"
+    runs = []
+    for _ in range(repeat):
+        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+        spec = json.dumps({"benchmark": benchmark, "scene": scene_name, "attributes": attributes})
+        result = subprocess.run(
+            [sys.executable, __file__, "--measure", spec, "--output", str(output)],
+            cwd=PROJECT_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{benchmark} failed:\n{result.stderr[-2000:]}")
+        runs.append(json.loads(output.read_text()))
+        output.unlink()
+    return {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+
+
+def compare(results, baseline, thresholds=THRESHOLDS):
+    """Lines describing every metric of ``results`` that regressed past its threshold."""
+    regressions = []
+    for benchmark, metrics in results.items():
+        if benchmark not in baseline:
+            continue
+        for metric, limit in thresholds.items():
+            old, new = baseline[benchmark].get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            worse, better = (old, new) if metric in HIGHER_IS_BETTER else (new, old)
+            if worse > better * limit:
+                regressions.append(
+                    f"{benchmark} {metric}: {old:.4g} -> {new:.4g} (limit x{limit:g})"
+                )
+    return regressions
+
+
+def format_results(results, baseline=None):
+    baseline = baseline or {}
+    lines = [
+        f"{'benchmark':<24} {'wall s':>8} {'frames':>7} {'fps':>7} "
+        f"{'RSS MiB':>8} {'LaTeX':>6} {'encode s':>9}"
+    ]
+    for benchmark, metrics in results.items():
+        lines.append(
+            f"{benchmark:<24} {metrics['wall_seconds']:8.2f} {metrics['frames']:7.0f} "
+            f"{metrics['fps']:7.1f} {metrics['peak_rss_mib']:8.0f} "
+            f"{metrics['latex_compiles']:6.0f} {metrics['encoder_seconds']:9.2f}"
+        )
+        if benchmark in baseline:
+            wall = baseline[benchmark]["wall_seconds"]
+            lines[-1] += f"  ({metrics['wall_seconds'] / wall - 1:+.0%} wall)"
+    return "\n".join(lines)
+
+
+def parse_threshold(text):
+    metric, _, ratio = text.partition("=")
+    if metric not in THRESHOLDS:
+        raise argparse.ArgumentTypeError(
+            f"unknown metric {metric!r}, one of {', '.join(THRESHOLDS)}"
+        )
+    return metric, float(ratio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "benchmarks", nargs="*", help="scene or stress variant names (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per benchmark, medians kept")
+    parser.add_argument("--no-stress", action="store_true", help="skip the stress variants")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store these results as the new baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=parse_threshold,
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="override a regression threshold",
+    )
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        spec = json.loads(args.measure)
+        metrics = measure(spec["benchmark"], spec["scene"], spec["attributes"])
+        args.output.write_text(json.dumps(metrics))
+        return
+
+    results = {}
+    for benchmark, (scene_name, attributes) in benchmarks(
+        args.benchmarks, not args.no_stress
+    ).items():
+        results[benchmark] = run_benchmark(benchmark, scene_name, attributes, args.repeat)
+        print(f"measured {benchmark} in {results[benchmark]['wall_seconds']:.1f}s")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print(format_results(results, baseline))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2))
+        print(f"saved baseline to {args.baseline}")
+        return
+    regressions = compare(results, baseline, {**THRESHOLDS, **dict(args.threshold)})
+    if regressions:
+        raise SystemExit("regressions against the baseline:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
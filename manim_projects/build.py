@@ -0,0 +1,393 @@
+"""Render every scene in the project in parallel and regenerate the gallery.
+
+Scenes are found statically (any class deriving from a ``*Scene`` base in
+``manim_projects/*.py``), rendered concurrently with one ``manim`` process
+per scene, and skipped when neither their module, the local modules it
+imports, nor the render options changed since the last build::
+
+    python build.py                 # everything, -ql
+    python build.py -q h Testing    # one scene at 1080p60
+    python build.py --force
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import escape
+from pathlib import Path
+
+import publish
+import render_cache
+import tex_cache
+
+PROJECT_DIR = Path(__file__).resolve().parent
+REPO_DIR = PROJECT_DIR.parent
+MEDIA_DIR = PROJECT_DIR / "media"
+VIDEOS_DIR = REPO_DIR / "videos"
+INDEX_HTML = REPO_DIR / "index.html"
+BUILD_STATE = MEDIA_DIR / "build_state.json"
+
+QUALITY_DIRS = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+
+# Gallery order; scenes not listed here follow alphabetically.
+GALLERY_ORDER = [
+    "VolumeTheoremStatement",
+    "Testing",
+    "RevolveSurface",
+    "FunctionTendsToInfinity",
+    "LimitAtInfinity",
+]
+
+
+class SceneEntry:
+    def __init__(self, name, path):
+        self.name = name
+        self.path = Path(path)
+
+    @property
+    def module(self):
+        return self.path.stem
+
+    def output(self, quality):
+        return MEDIA_DIR / "videos" / self.module / QUALITY_DIRS[quality] / f"{self.name}.mp4"
+
+    def title(self):
+        words = []
+        for char in self.name:
+            if char.isupper() and words and not words[-1][-1].isupper():
+                words.append(char)
+            elif words:
+                words[-1] += char
+            else:
+                words.append(char)
+        return " ".join(words)
+
+    def __repr__(self):
+        return f"{self.module}.{self.name}"
+
+
+def find_scenes(project_dir=PROJECT_DIR):
+    scenes = []
+    for path in sorted(Path(project_dir).glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            # Scene base classes such as ``DepthSortScene`` have no ``construct`` to render.
+            constructs = any(
+                isinstance(item, ast.FunctionDef) and item.name == "construct" for item in node.body
+            )
+            if constructs and any(
+                isinstance(base, ast.Name) and base.id.endswith("Scene") for base in node.bases
+            ):
+                scenes.append(SceneEntry(node.name, path))
+    return scenes
+
+
+def find_scene(name):
+    for scene in find_scenes():
+        if scene.name == name:
+            return scene
+    raise KeyError(f"no scene named {name!r} in {PROJECT_DIR}")
+
+
+def load_scene_class(scene):
+    """Import ``scene``'s module the way ``manim render`` does and return the class."""
+    if str(PROJECT_DIR) not in sys.path:
+        sys.path.insert(0, str(PROJECT_DIR))
+    spec = importlib.util.spec_from_file_location(scene.module, scene.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[scene.module] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene.name)
+
+
+def quality_name(flag):
+    """``"l"`` -> ``"low_quality"``, as accepted by ``config.quality``."""
+    from manim.constants import QUALITIES
+
+    for name, quality in QUALITIES.items():
+        if quality["flag"] == flag:
+            return name
+    raise KeyError(flag)
+
+
+def gallery_order(scenes):
+    def key(scene):
+        if scene.name in GALLERY_ORDER:
+            return (0, GALLERY_ORDER.index(scene.name), "")
+        return (1, 0, scene.name)
+
+    return sorted(scenes, key=key)
+
+
+def local_dependencies(path, seen=None):
+    """``path`` plus every sibling module it imports, transitively."""
+    path = Path(path)
+    seen = set() if seen is None else seen
+    if path in seen:
+        return seen
+    seen.add(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            candidate = path.parent / f"{name.split('.')[0]}.py"
+            if candidate.exists():
+                local_dependencies(candidate, seen)
+    return seen
+
+
+def _manim_version():
+    try:
+        from importlib.metadata import version
+
+        return version("manim")
+    except Exception:
+        return "unknown"
+
+
+def fingerprint(scene, render_args):
+    digest = hashlib.sha256()
+    digest.update(scene.name.encode())
+    digest.update(json.dumps(render_args).encode())
+    digest.update(_manim_version().encode())
+    for dependency in sorted(local_dependencies(scene.path)):
+        digest.update(dependency.name.encode())
+        digest.update(dependency.read_bytes())
+    return digest.hexdigest()
+
+
+def load_state():
+    if BUILD_STATE.exists():
+        return json.loads(BUILD_STATE.read_text())
+    return {}
+
+
+def save_state(state):
+    BUILD_STATE.parent.mkdir(parents=True, exist_ok=True)
+    BUILD_STATE.write_text(json.dumps(state, indent=2, sort_keys=True))
+
+
+def render_command(scene, quality, stream=False):
+    # render_cache.py renders through manim and records which partials were used.
+    command = [
+        sys.executable, "render_cache.py", "render", scene.name,
+        "-q", quality,
+        # Renders share media/Tex; cleaning it up mid-build breaks other workers.
+        "--no_latex_cleanup",
+    ]
+    if stream:
+        command.append("--stream")
+    return command
+
+
+def render_scene(scene, quality, stream=False):
+    start = time.perf_counter()
+    result = subprocess.run(
+        render_command(scene, quality, stream),
+        cwd=PROJECT_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{scene} failed after {elapsed:.1f}s:\n{result.stdout[-4000:]}")
+    return elapsed
+
+
+GALLERY_SCRIPT = """\
+  <script>
+    // Posters load as videos near the viewport; browsers with native HLS stream the segments.
+    const nativeHls = document.createElement("video").canPlayType("application/vnd.apple.mpegurl");
+    const observer = new IntersectionObserver((entries) => {
+      for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        const video = entry.target;
+        observer.unobserve(video);
+        if (video.dataset.poster) video.poster = video.dataset.poster;
+        if (nativeHls && video.dataset.hls) video.src = video.dataset.hls;
+      }
+    }, { rootMargin: "300px" });
+    document.querySelectorAll("video").forEach((video) => observer.observe(video));
+  </script>
+"""
+
+
+def write_gallery(scenes, index_html=INDEX_HTML):
+    """Write the gallery page; nothing but the page itself loads before a video is played."""
+    root = index_html.parent
+    sections = []
+    for number, scene in enumerate(gallery_order(scenes), start=1):
+        attributes = ['width="640"', 'height="360"', "controls", 'preload="none"', "playsinline"]
+        poster = publish.poster_path(scene.name, VIDEOS_DIR)
+        if poster.exists():
+            attributes.append(f'data-poster="{escape(poster.relative_to(root).as_posix())}"')
+        # The master playlist adds the rendition ladder to the published stream.
+        playlist = publish.master_playlist_path(scene.name, VIDEOS_DIR)
+        if not playlist.exists():
+            playlist = publish.playlist_path(scene.name, VIDEOS_DIR)
+        if playlist.exists():
+            attributes.append(f'data-hls="{escape(playlist.relative_to(root).as_posix())}"')
+        src = f"videos/{scene.name}.mp4"
+        sections.append(
+            f"  <h2>{number}. {escape(scene.title())}</h2>\n"
+            f"  <video {' '.join(attributes)}>\n"
+            f'    <source src="{escape(src)}" type="video/mp4">\n'
+            f"    Your browser does not support the video tag.\n"
+            f"  </video>\n"
+        )
+    index_html.write_text(
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n'
+        "<head>\n"
+        '  <meta charset="UTF-8" />\n'
+        '  <meta name="viewport" content="width=device-width, initial-scale=1.0"/>\n'
+        "  <title>Calc 2 Video Series</title>\n"
+        "</head>\n"
+        "<body>\n"
+        "  <h1>Calculus 2 Videos</h1>\n\n"
+        + "\n".join(sections)
+        + GALLERY_SCRIPT
+        + "</body>\n"
+        "</html>\n",
+        encoding="utf-8",
+    )
+
+
+def build(
+    names=None,
+    quality="l",
+    jobs=None,
+    force=False,
+    prewarm=True,
+    cache_size=None,
+    stream=False,
+    ladder=publish.LADDER,
+):
+    """Render the selected scenes concurrently and refresh ``videos/`` and ``index.html``.
+
+    Each published scene is then transcoded into the renditions of ``ladder``
+    (none if it is empty); renditions of unchanged renders are kept.
+
+    Returns ``{scene name: seconds}`` for the scenes that were rendered.
+    """
+    scenes = find_scenes()
+    selected = [scene for scene in scenes if not names or scene.name in names]
+    state = load_state()
+
+    stale = []
+    for scene in selected:
+        key = fingerprint(scene, {"quality": quality})
+        if force or state.get(scene.name) != key or not scene.output(quality).exists():
+            stale.append((scene, key))
+        else:
+            print(f"up to date: {scene}")
+
+    if stale and prewarm:
+        compiled, _, _ = tex_cache.prewarm(sorted({scene.path for scene, _ in stale}), jobs)
+        print(f"prewarmed {compiled} Tex SVGs")
+
+    timings = {}
+    failures = []
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = {
+            pool.submit(render_scene, scene, quality, stream): (scene, key)
+            for scene, key in stale
+        }
+        for future in as_completed(futures):
+            scene, key = futures[future]
+            try:
+                timings[scene.name] = future.result()
+            except RuntimeError as error:
+                failures.append(error)
+                continue
+            state[scene.name] = key
+            save_state(state)
+            print(f"rendered {scene} in {timings[scene.name]:.1f}s")
+
+    evicted = render_cache.evict(cache_size or render_cache.DEFAULT_MAX_SIZE)
+    if evicted:
+        print(f"evicted {len(evicted)} stale partial movie files")
+
+    tex_cache.clean_tex_dir(MEDIA_DIR / "Tex")
+
+    published = []
+    for scene in scenes:
+        output = scene.output(quality)
+        if output.exists() and publish.publish(output, scene.name, VIDEOS_DIR):
+            print(f"published {scene}")
+        if (VIDEOS_DIR / output.name).exists():
+            published.append(scene)
+
+    if ladder:
+        masters = {
+            scene.name: scene.output(quality)
+            for scene in published
+            if scene.output(quality).exists()
+        }
+        try:
+            publish.transcode_ladder(masters, VIDEOS_DIR, ladder, jobs)
+        except RuntimeError as error:
+            failures.append(error)
+    # After the ladder, so the gallery points at the master playlists it wrote.
+    write_gallery(published)
+
+    if failures:
+        raise SystemExit("\n\n".join(str(error) for error in failures))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="ignore the build state")
+    parser.add_argument("--no-prewarm", action="store_true", help="skip the Tex pre-warm step")
+    parser.add_argument(
+        "--cache-size",
+        type=render_cache.parse_size,
+        default=render_cache.DEFAULT_MAX_SIZE,
+        help="size budget for partial movie files, e.g. 500M",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="encode each scene in one pass instead of one partial movie per play",
+    )
+    parser.add_argument(
+        "--ladder",
+        type=publish.parse_ladder,
+        default=publish.LADDER,
+        help="renditions to transcode, e.g. 360:600k,720:3000k",
+    )
+    parser.add_argument("--no-renditions", action="store_true", help="skip transcoding")
+    args = parser.parse_args()
+    build(
+        args.scenes,
+        args.quality,
+        args.jobs,
+        args.force,
+        not args.no_prewarm,
+        args.cache_size,
+        args.stream,
+        () if args.no_renditions else args.ladder,
+    )
+
+
+if __name__ == "__main__":
+    main()
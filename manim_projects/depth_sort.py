@@ -0,0 +1,69 @@
+from manim import *
+import numpy as np
+
+
+def reference_points(mobjects):
+    """``get_z_index_reference_point()`` of every mobject, as one ``(N, 3)`` array.
+
+    Childless mobjects, i.e. every surface face, get their bounding box
+    centres from one ``reduceat`` over their concatenated points.
+    """
+    simple = np.array([
+        not mob.submobjects and not hasattr(mob, "z_index_group") for mob in mobjects
+    ])
+    centers = np.empty((len(mobjects), 3))
+    if simple.any():
+        points = [mob.points for mob, is_simple in zip(mobjects, simple) if is_simple]
+        starts = np.cumsum([0] + [len(p) for p in points[:-1]])
+        stacked = np.concatenate(points)
+        mins = np.minimum.reduceat(stacked, starts)
+        maxs = np.maximum.reduceat(stacked, starts)
+        centers[simple] = (mins + maxs) / 2
+    for i in np.nonzero(~simple)[0]:
+        centers[i] = mobjects[i].get_z_index_reference_point()
+    return centers
+
+
+class DepthSortCamera(ThreeDCamera):
+    """:class:`ThreeDCamera` that depth-sorts with one array op per frame.
+
+    ``ThreeDCamera`` computes every face's centre in Python and sorts from
+    scratch each frame.  Here centres come from :func:`reference_points`, the
+    depth keys are one matrix product, and while the same faces stay on
+    screen the previous frame's order is re-sorted, which is nearly linear
+    for camera moves because the order barely changes.  Faces at equal depth
+    fall back to a fresh sort, so ties keep the order they were added in and
+    the draw order is the same as ``ThreeDCamera``'s.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sorted_ids = None
+        self._order = None
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        shaded = [mob for mob in mobjects if getattr(mob, "shade_in_3d", False)]
+        flat = [mob for mob in mobjects if not getattr(mob, "shade_in_3d", False)]
+        if not shaded:
+            return flat
+
+        depths = reference_points(shaded) @ self.get_rotation_matrix()[2]
+        ids = [id(mob) for mob in shaded]
+        order = None
+        if ids == self._sorted_ids:
+            order = self._order[np.argsort(depths[self._order], kind="stable")]
+            # Equal depths would keep last frame's order; ThreeDCamera keeps the original one.
+            if (np.diff(depths[order]) == 0).any():
+                order = None
+        if order is None:
+            order = np.argsort(depths, kind="stable")
+        self._sorted_ids = ids
+        self._order = order
+        # Flat mobjects sort last (depth inf) in their original order.
+        return [shaded[i] for i in order] + flat
+
+
+class DepthSortScene(ThreeDScene):
+    def __init__(self, camera_class=DepthSortCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
@@ -0,0 +1,105 @@
+"""Render single frames of a scene at given times, without rendering the video.
+
+Every play before a requested time is skipped to its end state (updaters
+still run), the play containing it is stepped to exactly that time, and
+only then is one frame rasterized.  Several times are handled in one pass
+through ``construct``::
+
+    python frames.py LimitAtInfinity 31.5
+    python frames.py RevolveSurface 2 6.5 12 -q h -o posters/
+"""
+
+import argparse
+from pathlib import Path
+
+from build import MEDIA_DIR, find_scene, load_scene_class, quality_name
+from timeline import skip_rasterizing
+
+FRAMES_DIR = MEDIA_DIR / "frames"
+
+
+def render_frames(name, times, out_dir=FRAMES_DIR, quality="l", resolution=None):
+    """Save the frame of scene ``name`` at each of ``times`` (seconds) as a PNG.
+
+    Times past the end of the scene give its last frame.  Returns the PNG paths
+    in the order of ``times``.
+    """
+    from manim import config, tempconfig
+    from PIL import Image
+
+    scene = find_scene(name)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(MEDIA_DIR),
+        "quality": quality_name(quality),
+        "dry_run": True,
+        "disable_caching": True,
+    }
+    if resolution:
+        width, height = resolution
+        options["pixel_width"], options["pixel_height"] = width, height
+        # Keep the scene's height and widen or narrow the frame, as ``manim -r`` does.
+        options["frame_width"] = config.frame_height * width / height
+
+    pending = sorted(set(float(t) for t in times))
+    saved = {}
+    with tempconfig(options):
+        instance = skip_rasterizing(load_scene_class(scene)(skip_animations=True))
+        instance.skip_animation_preview = True
+        renderer = instance.renderer
+        clock = [0.0]
+
+        def snapshot(t):
+            # The class methods draw even while skip_rasterizing keeps the plays from drawing.
+            renderer.static_image = None
+            type(renderer).update_frame(renderer, instance)
+            path = out_dir / f"{scene.name}_{t:07.2f}s.png"
+            Image.fromarray(type(renderer).get_frame(renderer)).save(path)
+            saved[t] = path
+
+        play = instance.play
+        update_to_time = instance.update_to_time
+
+        def step_to(t):
+            # A skipped play jumps straight to its run time; stop on the way for requested frames.
+            start = clock[0]
+            while pending and pending[0] - start < t:
+                update_to_time(max(pending[0] - start, 0))
+                snapshot(pending.pop(0))
+            update_to_time(t)
+
+        def play_and_capture(*args, **kwargs):
+            play(*args, **kwargs)
+            clock[0] += instance.duration
+            # Frozen waits never step through time; their frames are the current state.
+            while pending and pending[0] < clock[0]:
+                snapshot(pending.pop(0))
+
+        instance.update_to_time = step_to
+        instance.play = play_and_capture
+        instance.render()
+        while pending:
+            snapshot(pending.pop(0))
+
+    return [saved[float(t)] for t in times]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("times", nargs="+", type=float, help="timestamps in seconds")
+    parser.add_argument("-q", "--quality", default="l")
+    parser.add_argument(
+        "-r", "--resolution", help="W,H in pixels, overriding the quality's size"
+    )
+    parser.add_argument("-o", "--out-dir", default=FRAMES_DIR)
+    args = parser.parse_args()
+    resolution = tuple(int(n) for n in args.resolution.split(",")) if args.resolution else None
+    for path in render_frames(args.scene, args.times, args.out_dir, args.quality, resolution):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
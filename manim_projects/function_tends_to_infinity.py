@@ -1,28 +1,26 @@
 from manim import *
 
+from tex_cache import batch_typeset
+from vectorized import adaptive_plot
+
 # words * 3/5 = wpm
 
 class FunctionTendsToInfinity(Scene):
     def construct(self):
         ####################################################################################################
+        self.next_section("definition")
         # Title
         title = Tex(r"Definition of Function Tending to Infinity").scale(1.5)
         title.set_color(BLUE)
         title.to_edge(UP)
 
         # Definition lines
-        definition_1 = MathTex(
-            r"\text{Let } D \subseteq \mathbb{R} \text{ be unbounded above and } f:D\to\mathbb{R}."
-        )
-        definition_2 = MathTex(
-            r"f \text{ tends to } \infty \iff"
-        )
-        definition_3 = MathTex(
-            r"\forall k > 0, \text{ } \exists M \in \mathbb{R}^+ \text{ such that } f(x) > k,"
-        )
-        definition_4 = MathTex(
-            r"\forall x \in D \text{ such that } x \geq M."
-        )
+        definition_1, definition_2, definition_3, definition_4 = batch_typeset(MathTex, [
+            r"\text{Let } D \subseteq \mathbb{R} \text{ be unbounded above and } f:D\to\mathbb{R}.",
+            r"f \text{ tends to } \infty \iff",
+            r"\forall k > 0, \text{ } \exists M \in \mathbb{R}^+ \text{ such that } f(x) > k,",
+            r"\forall x \in D \text{ such that } x \geq M.",
+        ])
 
         # Grouping definitions
         definition_group = VGroup(definition_1, definition_2, definition_3, definition_4)
@@ -43,6 +41,7 @@ class FunctionTendsToInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("highlight")
         # Extract Key Parts for Highlighting
         k_part = definition_3[0][0:4].copy()  # \forall k > 0
         M_part = definition_3[0][5:10].copy()  # \exists M \in \mathbb{R}^+
@@ -70,6 +69,7 @@ class FunctionTendsToInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("to_do_list")
         # Duplicate and keep extracted text in place before moving
         k_part_moved = k_part.copy().move_to(k_part.get_center())
         M_part_moved = M_part.copy().move_to(M_part.get_center())
@@ -142,6 +142,7 @@ class FunctionTendsToInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("axes")
         # Axes
         axes = Axes(
             x_range=[0, 10, 1], y_range=[0, 10, 1],
@@ -155,12 +156,14 @@ class FunctionTendsToInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("function")
         # Function definition
-        func = axes.plot(lambda x: x, color=YELLOW)
+        func = adaptive_plot(axes, lambda x: x, color=YELLOW)
         self.play(Create(func, run_time=5))
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("k_and_M")
         # k and M illustration
         k_val = 5  # Selected k value
         M_val = 5  # Selected M value
@@ -178,7 +181,7 @@ class FunctionTendsToInfinity(Scene):
         M_label = MathTex("M", color=GREEN).next_to(M_line, DOWN)
 
         # Highlight function above M
-        highlight_region = axes.plot(lambda x: x, x_range=[M_val, 10], color=RED, stroke_width=6)
+        highlight_region = func.get_subcurve(M_val, 10, color=RED, stroke_width=6)
         
         # Animation sequence
         self.wait(1)
@@ -0,0 +1,174 @@
+from manim import *
+import numpy as np
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+
+_TOKEN = re.compile(r"\\[A-Za-z]+|\S")
+# Binary operators and relations get TeX-like space around them (unless unary).
+SPACED = {"+", "-", "=", "<", ">", r"\pm", r"\cdot", r"\times", r"\le", r"\ge", r"\approx", r"\to"}
+# As in TeX, an operator is unary at the start, after another one, an opening bracket or a comma.
+UNARY_AFTER = SPACED | {"(", "[", r"\langle", ",", ";"}
+# Every glyph sheet includes a digit so glyphs from different sheets share a baseline.
+_BASELINE_REFERENCE = "0"
+
+
+def tokenize(text):
+    """Split a flat math label into glyph tokens: ``\\epsilon=0.5`` -> ``\\epsilon``, ``=``, ``0``..."""
+    tokens = _TOKEN.findall(text)
+    if any(token in ("^", "_", "{", "}") for token in tokens):
+        raise ValueError(f"{text!r} has structure; glyph labels are one row of symbols, use MathTex")
+    return tokens
+
+
+class GlyphCache:
+    """Outlines of single math glyphs, typeset once per TeX template.
+
+    Glyphs are compiled at ``DEFAULT_FONT_SIZE``, all missing ones in one
+    ``MathTex`` (one LaTeX run), and scaled for other font sizes, which is
+    exact for outlines.  Up to ``max_glyphs`` stay in memory, least recently
+    used first out; every glyph also goes to ``media/glyphs/<template
+    hash>.npz`` so later processes skip TeX and SVG parsing entirely.  The
+    store sits outside ``media/Tex``, whose non-SVG files are cleaned up
+    after builds.
+    """
+
+    def __init__(self, tex_template=None, max_glyphs=256):
+        from manim.utils.tex_file_writing import tex_hash
+
+        self.tex_template = tex_template or config.tex_template
+        self.max_glyphs = max_glyphs
+        self.path = (
+            Path(config.get_dir("media_dir")) / "glyphs" / f"{tex_hash(self.tex_template.body)}.npz"
+        )
+        self._glyphs = OrderedDict()
+
+    def _read_store(self):
+        if not self.path.exists():
+            return {}
+        with np.load(self.path) as store:
+            return {
+                str(token): (store[f"glyph{i}"], float(width))
+                for i, (token, width) in enumerate(zip(store["tokens"], store["widths"]))
+            }
+
+    def _write_store(self, glyphs):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tokens = list(glyphs)
+        temp = self.path.with_name(f"{self.path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(
+            temp,
+            tokens=np.array(tokens),
+            widths=np.array([glyphs[token][1] for token in tokens]),
+            **{f"glyph{i}": glyphs[token][0] for i, token in enumerate(tokens)},
+        )
+        os.replace(temp, self.path)
+
+    def _compile(self, tokens):
+        sheet = MathTex(_BASELINE_REFERENCE, *tokens, tex_template=self.tex_template)
+        baseline = sheet[0].get_bottom()[1]
+        compiled = {}
+        for token, part in zip(tokens, sheet[1:]):
+            outlines = part.family_members_with_points()
+            if not outlines:
+                compiled[token] = (np.zeros((0, 3)), 0.0)
+                continue
+            points = np.concatenate([outline.points for outline in outlines])
+            points = points - np.array([part.get_left()[0], baseline, 0])
+            compiled[token] = (points, float(part.width))
+        return compiled
+
+    def _remember(self, token, glyph):
+        self._glyphs[token] = glyph
+        self._glyphs.move_to_end(token)
+        while len(self._glyphs) > self.max_glyphs:
+            self._glyphs.popitem(last=False)
+
+    def get(self, tokens):
+        """``[(points, width)]`` for ``tokens`` at ``DEFAULT_FONT_SIZE``, baseline at ``y = 0``."""
+        found = {token: self._glyphs[token] for token in tokens if token in self._glyphs}
+        missing = [token for token in dict.fromkeys(tokens) if token not in found]
+        if missing:
+            stored = self._read_store()
+            uncompiled = [token for token in missing if token not in stored]
+            if uncompiled:
+                stored.update(self._compile(uncompiled))
+                self._write_store(stored)
+            found.update((token, stored[token]) for token in missing)
+        # Remember only once the result is complete: a label can hold more than max_glyphs.
+        for token in dict.fromkeys(tokens):
+            self._remember(token, found[token])
+        return [found[token] for token in tokens]
+
+
+_caches = {}
+
+
+def glyph_cache(tex_template=None):
+    template = tex_template or config.tex_template
+    if template.body not in _caches:
+        _caches[template.body] = GlyphCache(template)
+    return _caches[template.body]
+
+
+class GlyphText(VMobject):
+    """A one-row math label assembled from cached glyph outlines, without TeX.
+
+    Meant for short labels and numbers (``"M"``, ``"f(x)"``,
+    ``"\\epsilon=0.25"``); anything with sub/superscripts or groups needs
+    ``MathTex``.  ``set_text`` swaps the glyphs in place, keeping
+    ``aligned_edge`` of the label where it was.
+    """
+
+    def __init__(
+        self,
+        text,
+        font_size=DEFAULT_FONT_SIZE,
+        tex_template=None,
+        aligned_edge=LEFT,
+        fill_opacity=1.0,
+        stroke_width=0,
+        **kwargs,
+    ):
+        self.cache = glyph_cache(tex_template)
+        self.font_size = font_size
+        self.aligned_edge = aligned_edge
+        self.text = None
+        super().__init__(fill_opacity=fill_opacity, stroke_width=stroke_width, **kwargs)
+        self.set_text(text)
+
+    def set_text(self, text):
+        if text == self.text:
+            return self
+        anchor = self.get_critical_point(self.aligned_edge) if self.has_points() else None
+        self.text = text
+
+        tokens = tokenize(text)
+        unit = self.font_size / DEFAULT_FONT_SIZE
+        # DecimalNumber's spacing between digits; operators get about a quarter em each side.
+        buff = 0.001 * DEFAULT_FONT_SIZE
+        pieces = []
+        x = 0.0
+        for i, (token, (points, width)) in enumerate(zip(tokens, self.cache.get(tokens))):
+            binary = token in SPACED and i > 0 and tokens[i - 1] not in UNARY_AFTER
+            gap = 0.2 if binary else 0.0
+            x += gap
+            pieces.append(points + np.array([x, 0, 0]))
+            x += width + gap + buff
+        self.points = np.concatenate(pieces) * unit if pieces else np.zeros((0, 3))
+
+        if anchor is not None:
+            self.shift(anchor - self.get_critical_point(self.aligned_edge))
+        return self
+
+
+def glyph_readout(value, num_decimal_places=2, prefix="", **kwargs):
+    """A :class:`GlyphText` showing ``prefix`` and ``value()``, re-laid out whenever it changes."""
+
+    def text():
+        return f"{prefix}{value():.{num_decimal_places}f}"
+
+    readout = GlyphText(text(), **kwargs)
+    readout.add_updater(lambda m: m.set_text(text()))
+    return readout
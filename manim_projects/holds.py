@@ -0,0 +1,48 @@
+"""Encode static ``wait()`` holds as one frame held for the whole duration.
+
+manim already spots a frozen ``wait`` (no time-based updaters, no
+``stop_condition``) and rasterizes it once, but its segment encoder still
+converts and encodes that frame once per output frame: a ``self.wait(5)``
+at 1080p60 is 300 identical frames through x264.  ``StaticHoldEncoder``
+encodes the first and the last frame of a hold and leaves the gap in the
+timestamps, so the segment plays for the same duration from two encoded
+frames.  Concatenation copies packets with their timestamps, so the hold
+survives into the final movie.  GIF output re-stamps every frame instead,
+which would shrink each hold to two frames, so it keeps encoding holds
+frame by frame.
+"""
+
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+
+class StaticHoldEncoder(VideoSegmentEncoder):
+    def __init__(self, *, gaps=True, **kwargs):
+        super().__init__(**kwargs)
+        # Without gaps this is a plain VideoSegmentEncoder, for outputs that drop timestamps.
+        self.gaps = gaps
+
+    def write_frame(self, pixels, *, repeat=1):
+        if repeat <= 2 or not self.gaps:
+            return super().write_frame(pixels, repeat=repeat)
+        self._validate_frame(pixels, repeat)
+        start = self._next_pts
+        super().write_frame(pixels)
+        # The hold's last frame pins the segment's end; nothing is encoded in between.
+        self._next_pts = start + repeat - 1
+        super().write_frame(pixels)
+
+
+def enable_static_holds(scene):
+    """Make ``scene``'s file writer encode frozen holds with :class:`StaticHoldEncoder`.
+
+    GIF output is left as it is, since it does not keep the holds' gaps.
+    """
+    writer = scene.renderer.file_writer
+    if writer.output_spec.is_gif:
+        return scene
+
+    def create_segment_encoder(target):
+        return StaticHoldEncoder(target=target, spec=writer.video_encoder)
+
+    writer._create_segment_encoder = create_segment_encoder
+    return scene
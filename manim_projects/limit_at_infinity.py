@@ -1,29 +1,27 @@
 from manim import *
 
+from glyphs import glyph_readout
+from tex_cache import batch_typeset
+from trackers import TrackedDashedLine, follow
+from vectorized import adaptive_plot
+
 class LimitAtInfinity(Scene):
     def construct(self):
         ####################################################################################################
+        self.next_section("definition")
         # Title
         title = Tex(r"Definition of Limit at Infinity").scale(1.5)
         title.set_color(BLUE)
         title.to_edge(UP)
 
         # Definition lines
-        definition_1 = MathTex(
-            r"\text{Let } D \subseteq \mathbb{R} \text{ be unbounded above and } f:D\to\mathbb{R}."
-        )
-        definition_2 = MathTex(
-            r"f \text{ has a limit at } \infty \iff"
-        )
-        definition_3 = MathTex(
-            r"\exists L \in \mathbb{R} \text{ such that } \forall \epsilon > 0,"
-        )
-        definition_4 = MathTex(
-            r"\exists M > 0 \text{ such that } |f(x) - L| < \epsilon,"
-        )
-        definition_5 = MathTex(
-            r"\forall x \in D \text{ such that } x \geq M."
-        )
+        definition_1, definition_2, definition_3, definition_4, definition_5 = batch_typeset(MathTex, [
+            r"\text{Let } D \subseteq \mathbb{R} \text{ be unbounded above and } f:D\to\mathbb{R}.",
+            r"f \text{ has a limit at } \infty \iff",
+            r"\exists L \in \mathbb{R} \text{ such that } \forall \epsilon > 0,",
+            r"\exists M > 0 \text{ such that } |f(x) - L| < \epsilon,",
+            r"\forall x \in D \text{ such that } x \geq M.",
+        ])
 
         # Grouping definitions
         definition_group = VGroup(definition_1, definition_2, definition_3, definition_4, definition_5)
@@ -46,6 +44,7 @@ class LimitAtInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("highlight")
         # Extract Key Parts for Highlighting
         L_part = definition_3[0][0:4].copy()  # \exists L \in \mathbb{R}
         epsilon_part = definition_3[0][12:16].copy()  # \forall \epsilon > 0
@@ -76,6 +75,7 @@ class LimitAtInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("to_do_list")
         # Duplicate and keep extracted text in place before moving
         L_part_moved = L_part.copy().move_to(L_part.get_center())
         epsilon_part_moved = epsilon_part.copy().move_to(epsilon_part.get_center())
@@ -152,6 +152,7 @@ class LimitAtInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("axes")
         # Graphical representation
         axes = Axes(
             x_range=[0, 10, 1], y_range=[0, 5, 1],
@@ -165,7 +166,8 @@ class LimitAtInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
-        graph = axes.plot(lambda x: 3 + 1/x, x_range=[1, 10], color=BLUE)
+        self.next_section("graph")
+        graph = adaptive_plot(axes, lambda x: 3 + 1/x, x_range=[1, 10], color=BLUE)
         L_line = DashedLine(start=axes.c2p(0, 3), end=axes.c2p(10, 3), color=YELLOW)
         L_label = MathTex("L").next_to(axes.c2p(0, 3), LEFT, buff=0.2)
         
@@ -174,23 +176,43 @@ class LimitAtInfinity(Scene):
         ####################################################################################################
 
         ####################################################################################################
+        self.next_section("epsilon_band")
         # Epsilon band
-        epsilon = 0.5
-        upper_band = DashedLine(start=axes.c2p(0, 3 + epsilon), end=axes.c2p(10, 3 + epsilon), color=RED)
-        upper_label = MathTex("L + \epsilon").next_to(axes.c2p(0, 3 + epsilon), LEFT, buff=0.2)
+        epsilon = ValueTracker(0.5)
+        upper_band = TrackedDashedLine(
+            lambda: axes.c2p(0, 3 + epsilon.get_value()),
+            lambda: axes.c2p(10, 3 + epsilon.get_value()),
+            color=RED,
+        )
+        upper_label = follow(MathTex("L + \epsilon"), lambda: axes.c2p(0, 3 + epsilon.get_value()), LEFT, buff=0.2)
         
-        lower_band = DashedLine(start=axes.c2p(0, 3 - epsilon), end=axes.c2p(10, 3 - epsilon), color=RED)
-        lower_label = MathTex("L - \epsilon").next_to(axes.c2p(0, 3 - epsilon), LEFT, buff=0.2)
+        lower_band = TrackedDashedLine(
+            lambda: axes.c2p(0, 3 - epsilon.get_value()),
+            lambda: axes.c2p(10, 3 - epsilon.get_value()),
+            color=RED,
+        )
+        lower_label = follow(MathTex("L - \epsilon"), lambda: axes.c2p(0, 3 - epsilon.get_value()), LEFT, buff=0.2)
         
         self.play(Create(upper_band), Create(lower_band), Write(upper_label), Write(lower_label))
         
         # Showing M condition
-        M_value = 4
-        M_line = DashedLine(start=axes.c2p(M_value, 0), end=axes.c2p(M_value, 5), color=GREEN)
-        M_label = MathTex("M").next_to(axes.c2p(M_value, 0), DOWN, buff=0.2)
+        M_value = ValueTracker(4)
+        M_line = TrackedDashedLine(
+            lambda: axes.c2p(M_value.get_value(), 0),
+            lambda: axes.c2p(M_value.get_value(), 5),
+            color=GREEN,
+        )
+        M_label = follow(MathTex("M"), lambda: axes.c2p(M_value.get_value(), 0), DOWN, buff=0.2)
         
         self.play(Create(M_line), Write(M_label))
         self.wait(2)
+
+        # A narrower band needs a larger M: 3 + 1/x is within epsilon of 3 once x > 1/epsilon
+        epsilon_readout = glyph_readout(epsilon.get_value, prefix=r"\epsilon=", color=RED)
+        epsilon_readout.next_to(axes.c2p(10, 5), UP)
+        self.play(FadeIn(epsilon_readout))
+        self.play(epsilon.animate.set_value(0.2), M_value.animate.set_value(6), run_time=3)
+        self.wait(2)
         
         self.play(FadeOut(*self.mobjects))
         ####################################################################################################
@@ -0,0 +1,318 @@
+"""Profile a scene render play by play.
+
+Every ``play`` and ``wait`` becomes one entry with its source line,
+animations, frame count, the mobjects and points on screen afterwards, and
+where its time went: building mobjects before it (``setup``, of which
+``latex``), interpolating animations, updaters, rasterizing, and encoding
+on the segment encoder threads.  Times are exclusive, so the phases timed
+inside a play add up to its wall time.  Caching is off, so every play
+really renders.
+
+The table prints sorted by any column; the full trace goes to a Chrome
+trace (open in ``chrome://tracing``, Perfetto or speedscope) and,
+optionally, folded stacks for ``flamegraph.pl``::
+
+    python profiling.py LimitAtInfinity
+    python profiling.py LimitAtInfinity --sort rasterize --top 10
+    python profiling.py Testing --cold-tex --folded testing.folded
+"""
+
+import argparse
+import json
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from build import MEDIA_DIR, find_scene, load_scene_class
+from timeline import _call_site, _describe
+
+PROFILE_DIR = MEDIA_DIR / "profile"
+PHASES = ("setup", "latex", "interpolate", "updaters", "rasterize", "other", "encode")
+COLUMNS = ("wall", "frames", *PHASES, "mobjects", "points")
+
+
+class PlayProfiler:
+    """Time spans of one scene render, attributed to the play they happened in.
+
+    Spans on the main thread nest, and each adds its exclusive time (minus
+    its child spans) to the current play.  Between plays only LaTeX is
+    timed; the rest of that gap is the next play's ``setup``.  Encoder spans
+    run on other threads and count against the play whose segment they
+    encode.
+    """
+
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.thread_names = {}
+        self.plays = []
+        self.pending = dict.fromkeys(PHASES, 0.0)
+        self.current = None
+        self._idle_since = self.origin
+        self._children = []
+        self._lock = threading.Lock()
+        self._main_thread = threading.get_ident()
+
+    def _us(self, moment):
+        return (moment - self.origin) * 1e6
+
+    def _event(self, name, phase, start, end, args=None):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": phase,
+            "ph": "X",
+            "ts": self._us(start),
+            "dur": (end - start) * 1e6,
+            "pid": 1,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.thread_names[thread.ident] = thread.name
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, phase, name=None, play=None, args=None):
+        """Record a span of ``phase``; ``play`` is only passed from encoder threads."""
+        on_main = threading.get_ident() == self._main_thread
+        if on_main:
+            play = self.current
+            self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._event(name or phase, phase, start, end, args)
+            exclusive = end - start
+            if on_main:
+                exclusive -= self._children.pop()
+                if self._children:
+                    self._children[-1] += end - start
+            with self._lock:
+                (play if play is not None else self.pending)[phase] += exclusive
+
+    def begin_play(self, kind, line, source):
+        now = time.perf_counter()
+        play = {
+            "index": len(self.plays),
+            "kind": kind,
+            "line": line,
+            "source": source,
+            "frames": 0,
+            **self.pending,
+        }
+        # Whatever ran since the previous play and was not timed built this play's mobjects.
+        play["setup"] += now - self._idle_since - sum(self.pending.values())
+        self._event(f"setup {play['index']}", "setup", self._idle_since, now)
+        self.pending = dict.fromkeys(PHASES, 0.0)
+        self.plays.append(play)
+        self.current = play
+        return play
+
+    def end_play(self, play, wall, animations, mobjects, points):
+        play["wall"] = wall
+        play["animations"] = animations
+        play["mobjects"] = mobjects
+        play["points"] = points
+        self.current = None
+        self._idle_since = time.perf_counter()
+
+    def chrome_trace(self):
+        """The spans as Chrome trace events, one track per thread."""
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.scene_name}}
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def folded_stacks(self):
+        """``scene;play;phase microseconds`` lines, the input format of ``flamegraph.pl``."""
+        lines = []
+        for play in self.plays:
+            frame = f"{self.scene_name};{play['kind']} {play['index']} line {play['line']}"
+            for phase in PHASES:
+                if play[phase] > 0:
+                    lines.append(f"{frame};{phase} {round(play[phase] * 1e6)}")
+        return "\n".join(lines) + "\n"
+
+
+def _family_counts(instance):
+    from manim.utils.family import extract_mobject_family_members
+
+    family = extract_mobject_family_members(instance.mobjects)
+    return len(family), sum(len(mobject.points) for mobject in family)
+
+
+def _timed(profiler, phase, method, name=None):
+    def wrapper(*args, **kwargs):
+        with profiler.span(phase, name):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument(instance, profiler, path):
+    """Patch ``instance``'s plays, phases and encoders to report to ``profiler``."""
+    renderer = instance.renderer
+    writer = renderer.file_writer
+    play = instance.play
+    wait = instance.wait
+    depth = [0]
+
+    def profiled(kind, method):
+        def wrapper(*args, **kwargs):
+            if depth[0]:
+                return method(*args, **kwargs)
+            line, source = _call_site(path)
+            record = profiler.begin_play(kind, line, source)
+            depth[0] += 1
+            started = time.perf_counter()
+            name = f"{kind} {record['index']}" + (f" (line {line})" if line else "")
+            try:
+                with profiler.span("other", name, args={"source": source}):
+                    method(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+            animations = [_describe(animation) for animation in instance.animations or ()]
+            profiler.end_play(
+                record, time.perf_counter() - started, animations, *_family_counts(instance)
+            )
+
+        return wrapper
+
+    instance.play = profiled("play", play)
+    instance.wait = profiled("wait", wait)
+    instance.update_to_time = _timed(profiler, "interpolate", instance.update_to_time)
+    instance.update_mobjects = _timed(profiler, "updaters", instance.update_mobjects)
+    renderer.update_frame = _timed(profiler, "rasterize", renderer.update_frame)
+
+    write_frame = writer.write_frame
+    create_segment_encoder = writer._create_segment_encoder
+
+    def count_frames(pixels, *, repeat=1):
+        if profiler.current is not None:
+            profiler.current["frames"] += repeat
+        return write_frame(pixels, repeat=repeat)
+
+    def create_profiled_encoder(target):
+        encoder = create_segment_encoder(target)
+        owner = profiler.current
+        for method in ("write_frame", "finish"):
+            original = getattr(encoder, method)
+
+            def timed(*args, _original=original, _method=method, **kwargs):
+                with profiler.span("encode", f"encode {_method}", play=owner):
+                    return _original(*args, **kwargs)
+
+            setattr(encoder, method, timed)
+        return encoder
+
+    writer.write_frame = count_frames
+    writer._create_segment_encoder = create_profiled_encoder
+    return instance
+
+
+@contextmanager
+def profile_latex(profiler):
+    """Time LaTeX runs and their SVG conversion, wherever in the scene they happen."""
+    from manim.utils import tex_file_writing
+
+    compile_tex = tex_file_writing.compile_tex
+    convert_to_svg = tex_file_writing.convert_to_svg
+    tex_file_writing.compile_tex = _timed(profiler, "latex", compile_tex, "compile_tex")
+    tex_file_writing.convert_to_svg = _timed(profiler, "latex", convert_to_svg, "convert_to_svg")
+    try:
+        yield
+    finally:
+        tex_file_writing.compile_tex = compile_tex
+        tex_file_writing.convert_to_svg = convert_to_svg
+
+
+def profile_scene(name, quality="l", cold_tex=False):
+    """Render scene ``name`` uncached under a :class:`PlayProfiler` and return the profiler."""
+    from manim import tempconfig
+
+    from build import quality_name
+    from holds import enable_static_holds
+
+    scene = find_scene(name)
+    work_dir = PROFILE_DIR / "media"
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(work_dir),
+        "quality": quality_name(quality),
+        "disable_caching": True,
+        "tex_dir": str((work_dir if cold_tex else MEDIA_DIR) / "Tex"),
+    }
+    if cold_tex:
+        shutil.rmtree(work_dir / "Tex", ignore_errors=True)
+
+    profiler = PlayProfiler(scene.name)
+    with tempconfig(options), profile_latex(profiler):
+        instance = enable_static_holds(load_scene_class(scene)())
+        instrument(instance, profiler, str(scene.path))
+        instance.render()
+    return profiler
+
+
+def format_table(plays, sort="index", top=None):
+    rows = sorted(plays, key=lambda play: play[sort], reverse=sort != "index")[:top]
+    header = f"{'#':>4} {'kind':<5} {'line':>5} " + " ".join(f"{c:>11}" for c in COLUMNS)
+    lines = [header + "  animations"]
+    for play in rows:
+        cells = []
+        for column in COLUMNS:
+            value = play[column]
+            cells.append(f"{value:11d}" if isinstance(value, int) else f"{value:11.3f}")
+        animations = ", ".join(animation["animation"] for animation in play["animations"])
+        lines.append(
+            f"{play['index']:>4} {play['kind']:<5} {play['line'] or '':>5} "
+            + " ".join(cells)
+            + f"  {animations}"
+        )
+    totals = {column: sum(play[column] for play in plays) for column in ("wall", *PHASES)}
+    lines.append(
+        f"total wall {totals['wall']:.2f}s in {len(plays)} plays; "
+        + ", ".join(f"{phase} {totals[phase]:.2f}s" for phase in PHASES)
+    )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="l")
+    parser.add_argument("--sort", choices=("index", *COLUMNS), default="index")
+    parser.add_argument("--top", type=int, default=None, help="only the first N rows")
+    parser.add_argument(
+        "--trace", type=Path, help="Chrome trace path (default: media/profile/<Scene>.trace.json)"
+    )
+    parser.add_argument("--folded", type=Path, help="also write folded stacks for flamegraph.pl")
+    parser.add_argument("--json", type=Path, help="also write the per-play records")
+    parser.add_argument(
+        "--cold-tex", action="store_true", help="start from an empty Tex cache to time LaTeX"
+    )
+    args = parser.parse_args()
+
+    profiler = profile_scene(args.scene, args.quality, args.cold_tex)
+    trace = args.trace or PROFILE_DIR / f"{profiler.scene_name}.trace.json"
+    trace.parent.mkdir(parents=True, exist_ok=True)
+    trace.write_text(json.dumps(profiler.chrome_trace()))
+    if args.folded:
+        args.folded.write_text(profiler.folded_stacks())
+    if args.json:
+        args.json.write_text(json.dumps(profiler.plays, indent=2))
+    print(format_table(profiler.plays, args.sort, args.top))
+    print(f"trace written to {trace}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""Package a rendered scene for the gallery: faststart mp4, poster and HLS segments.
+
+For ``videos/<Scene>.mp4`` this writes
+
+* ``videos/<Scene>.mp4`` with its index moved to the front (``+faststart``),
+  so playback starts before the whole file has downloaded;
+* ``videos/posters/<Scene>.jpg``, a frame from 40% into the video;
+* ``videos/hls/<Scene>/index.m3u8`` with fixed-length fMP4 segments.
+
+``--renditions`` also transcodes the master into a ladder of resolutions and
+bitrates, ``videos/renditions/<Scene>/<rung>-<hash>.mp4``, a few ffmpeg
+processes at a time, each segmented for HLS next to it.  The hash covers
+the master's bytes and the rung's settings, so a rung is only encoded
+again when one of them changed.  ``videos/renditions/<Scene>/master.m3u8``
+lists every rung and the stream above, for players to switch between::
+
+    python publish.py media/videos/limit_at_infinity/480p15/LimitAtInfinity.mp4
+    python publish.py --renditions media/videos/testing/1080p60/Testing.mp4
+    python publish.py --renditions --ladder 480:1000k,1080:4500k Testing.mp4
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+VIDEOS_DIR = REPO_DIR / "videos"
+SEGMENT_SECONDS = 4
+POSTER_AT = 0.4
+# (height, video bitrate); rungs taller than the master are skipped, never upscaled.
+LADDER = (
+    (360, "600k"),
+    (720, "1500k"),
+    (720, "3000k"),
+    (1080, "3000k"),
+    (1080, "6000k"),
+)
+# libx264 already uses several threads per process.
+TRANSCODE_JOBS = max(1, (os.cpu_count() or 1) // 4)
+
+
+def _ffmpeg(*args):
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", *map(str, args)], check=True)
+
+
+def probe_duration(path):
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(path),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip())
+
+
+def probe_size(path):
+    """``(width, height)`` of the first video stream of ``path``."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=width,height",
+            "-of", "csv=p=0",
+            str(path),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    width, height = result.stdout.strip().split(",")
+    return int(width), int(height)
+
+
+def poster_path(name, videos_dir=VIDEOS_DIR):
+    return Path(videos_dir) / "posters" / f"{name}.jpg"
+
+
+def playlist_path(name, videos_dir=VIDEOS_DIR):
+    return Path(videos_dir) / "hls" / name / "index.m3u8"
+
+
+def faststart(source, target):
+    _ffmpeg("-i", source, "-c", "copy", "-movflags", "+faststart", target)
+
+
+def make_poster(source, target, at=POSTER_AT):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _ffmpeg(
+        "-ss", f"{probe_duration(source) * at:.3f}",
+        "-i", source,
+        "-frames:v", "1",
+        "-q:v", "3",
+        target,
+    )
+
+
+def _hls(source, playlist, *codec_args, seconds=SEGMENT_SECONDS):
+    playlist.parent.mkdir(parents=True, exist_ok=True)
+    for old in playlist.parent.iterdir():
+        if old.is_file():
+            old.unlink()
+    _ffmpeg(
+        "-i", source,
+        *codec_args,
+        "-an",
+        "-f", "hls",
+        "-hls_time", seconds,
+        "-hls_playlist_type", "vod",
+        "-hls_segment_type", "fmp4",
+        "-hls_segment_filename", playlist.parent / "segment_%03d.m4s",
+        playlist,
+    )
+
+
+def _keyframes(seconds=SEGMENT_SECONDS):
+    return ("-force_key_frames", f"expr:gte(t,n_forced*{seconds})")
+
+
+def segment(source, playlist, seconds=SEGMENT_SECONDS):
+    """Re-encode with a keyframe every ``seconds`` so every segment has the same length."""
+    _hls(
+        source,
+        playlist,
+        "-c:v", "libx264", "-pix_fmt", "yuv420p",
+        *_keyframes(seconds),
+        seconds=seconds,
+    )
+
+
+def publish(source, name, videos_dir=VIDEOS_DIR, force=False):
+    """Write the faststart mp4, poster and HLS stream of ``source`` unless they are up to date."""
+    source = Path(source)
+    videos_dir = Path(videos_dir)
+    videos_dir.mkdir(parents=True, exist_ok=True)
+    mp4 = videos_dir / f"{name}.mp4"
+    outputs = [mp4, poster_path(name, videos_dir), playlist_path(name, videos_dir)]
+    if not force and all(
+        path.exists() and path.stat().st_mtime >= source.stat().st_mtime for path in outputs
+    ):
+        return False
+    faststart(source, mp4)
+    make_poster(source, outputs[1])
+    segment(source, outputs[2])
+    return True
+
+
+def parse_ladder(text):
+    """``"360:600k,1080:6000k"`` -> ``((360, "600k"), (1080, "6000k"))``."""
+    rungs = []
+    for rung in text.split(","):
+        height, _, bitrate = rung.strip().partition(":")
+        if not height.isdigit() or not bitrate:
+            raise argparse.ArgumentTypeError(f"bad rung {rung!r}, expected HEIGHT:BITRATE")
+        rungs.append((int(height), bitrate))
+    return tuple(rungs)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def renditions_dir(name, videos_dir=VIDEOS_DIR):
+    return Path(videos_dir) / "renditions" / name
+
+
+def rung_playlist(rendition):
+    return rendition.with_suffix("") / "index.m3u8"
+
+
+def transcode(source, target, height, bitrate):
+    """Encode one rung to ``target``, keyframes on segment bounds, then segment it for HLS."""
+    if not target.exists():
+        temp = target.with_name(f"{target.stem}.tmp{target.suffix}")
+        _ffmpeg(
+            "-i", source,
+            "-vf", f"scale=-2:{height}",
+            "-c:v", "libx264", "-preset", "medium", "-pix_fmt", "yuv420p",
+            "-b:v", bitrate, "-maxrate", bitrate, "-bufsize", bitrate,
+            *_keyframes(),
+            "-an",
+            "-movflags", "+faststart",
+            temp,
+        )
+        os.replace(temp, target)
+    _hls(target, rung_playlist(target), "-c", "copy")
+
+
+def peak_bandwidth(playlist):
+    """Peak segment bitrate of a VOD ``playlist`` in bits/s, what ``BANDWIDTH`` asks for."""
+    peak = 0
+    duration = None
+    for line in playlist.read_text().splitlines():
+        if line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:"):].split(",")[0])
+        elif line and not line.startswith("#") and duration:
+            peak = max(peak, (playlist.parent / line).stat().st_size * 8 / duration)
+            duration = None
+    return int(peak)
+
+
+def master_playlist_path(name, videos_dir=VIDEOS_DIR):
+    return renditions_dir(name, videos_dir) / "master.m3u8"
+
+
+def write_master_playlist(name, variants, videos_dir=VIDEOS_DIR):
+    """List ``[(playlist, (width, height))]`` as the variants of ``name``'s HLS stream."""
+    master = master_playlist_path(name, videos_dir)
+    streams = sorted((peak_bandwidth(playlist), size, playlist) for playlist, size in variants)
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for bandwidth, (width, height), playlist in streams:
+        lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}")
+        lines.append(Path(os.path.relpath(playlist, master.parent)).as_posix())
+    master.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return master
+
+
+def transcode_ladder(masters, videos_dir=VIDEOS_DIR, ladder=LADDER, jobs=None):
+    """Encode every rung of ``ladder`` for each ``{name: master}``, ``jobs`` at a time.
+
+    Rungs whose ``<rung>-<hash>.mp4`` and HLS segments already exist are
+    not encoded again; renditions of older masters or settings are removed.
+    Each scene gets a ``master.m3u8`` over its rungs and its published
+    stream.  Returns the number of encodes.
+    """
+    planned = {}
+    sizes = {}
+    for name, master in masters.items():
+        master_hash = file_digest(master)
+        sizes[name] = probe_size(master)
+        directory = renditions_dir(name, videos_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        planned[name] = []
+        for height, bitrate in ladder:
+            if height > sizes[name][1]:
+                continue
+            settings = f"{master_hash}:{height}:{bitrate}:{SEGMENT_SECONDS}"
+            key = hashlib.sha256(settings.encode()).hexdigest()[:12]
+            target = directory / f"{height}p-{bitrate}-{key}.mp4"
+            planned[name].append({"height": height, "bitrate": bitrate, "path": target})
+        keep = {rung["path"] for rung in planned[name]}
+        keep |= {path.with_suffix("") for path in keep}
+        for old in directory.iterdir():
+            if old.suffix == ".mp4" and old not in keep:
+                old.unlink()
+            elif old.is_dir() and old not in keep:
+                shutil.rmtree(old)
+
+    encoded = 0
+    failures = []
+    with ThreadPoolExecutor(max_workers=jobs or TRANSCODE_JOBS) as pool:
+        futures = {}
+        for name, rungs in planned.items():
+            for rung in rungs:
+                if rung_playlist(rung["path"]).exists():
+                    continue
+                future = pool.submit(
+                    transcode, masters[name], rung["path"], rung["height"], rung["bitrate"]
+                )
+                futures[future] = (name, rung)
+        for future in as_completed(futures):
+            name, rung = futures[future]
+            try:
+                future.result()
+            except subprocess.CalledProcessError as error:
+                failures.append(f"{name} {rung['height']}p {rung['bitrate']}: {error}")
+                continue
+            encoded += 1
+            print(f"encoded {name} {rung['height']}p {rung['bitrate']}")
+
+    for name, rungs in planned.items():
+        variants = [
+            (rung_playlist(rung["path"]), probe_size(rung["path"]))
+            for rung in rungs
+            if rung_playlist(rung["path"]).exists()
+        ]
+        if playlist_path(name, videos_dir).exists():
+            variants.append((playlist_path(name, videos_dir), sizes[name]))
+        if variants:
+            write_master_playlist(name, variants, videos_dir)
+    if failures:
+        raise RuntimeError("\n".join(failures))
+    return encoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("videos", nargs="+", type=Path, help="rendered scene videos")
+    parser.add_argument("--videos-dir", type=Path, default=VIDEOS_DIR)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--renditions", action="store_true", help="also transcode the ladder")
+    parser.add_argument(
+        "--ladder", type=parse_ladder, default=LADDER, help="e.g. 360:600k,720:3000k"
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="parallel ffmpeg encodes")
+    args = parser.parse_args()
+    for video in args.videos:
+        if publish(video, video.stem, args.videos_dir, args.force):
+            print(f"published {video.stem}")
+    if args.renditions:
+        masters = {video.stem: video for video in args.videos}
+        transcode_ladder(masters, args.videos_dir, args.ladder, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
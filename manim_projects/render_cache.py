@@ -0,0 +1,162 @@
+"""Keep the partial movie cache useful and bounded.
+
+manim already keys every play on its animations, the mobjects on screen
+and the camera, so an edit such as a new ``epsilon`` in ``LimitAtInfinity``
+only re-encodes the plays whose scene state changed.  What it lacks is a
+lifecycle: old partials pile up under ``media/videos/*/partial_movie_files``.
+
+``render`` renders a scene in-process and records which partial files its
+final movie used.  ``evict`` then deletes least-recently-used partials until
+the cache fits a size budget, never touching the files of any scene's latest
+render::
+
+    python render_cache.py render LimitAtInfinity -q l
+    python render_cache.py evict --max-size 500M
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import build
+
+PROJECT_DIR = Path(__file__).resolve().parent
+MEDIA_DIR = PROJECT_DIR / "media"
+USAGE_DIR = MEDIA_DIR / "render_cache"
+DEFAULT_MAX_SIZE = 500 * 1024 ** 2
+SIZE_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text):
+    text = str(text).strip().upper().rstrip("B")
+    if text and text[-1] in SIZE_UNITS:
+        return int(float(text[:-1]) * SIZE_UNITS[text[-1]])
+    return int(text)
+
+
+def _usage_file(scene, quality):
+    return USAGE_DIR / f"{scene.module}.{scene.name}.{quality}.json"
+
+
+def record_usage(scene, quality, partial_files):
+    """Remember the partial files of ``scene``'s latest render and when they were used."""
+    USAGE_DIR.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    usage = {
+        "scene": scene.name,
+        "quality": quality,
+        "rendered_at": now,
+        "files": sorted(str(Path(path).resolve()) for path in partial_files if path),
+    }
+    _usage_file(scene, quality).write_text(json.dumps(usage, indent=2))
+
+
+def render(name, quality="l", stream=False, **config_overrides):
+    """Render scene ``name`` with manim's play cache and record the partials it used.
+
+    With ``stream``, the movie is encoded in one pass by
+    :class:`streaming.StreamingFileWriter`, which still reuses and fills the partial cache.
+    """
+    from manim import tempconfig
+
+    from holds import enable_static_holds
+
+    scene = build.find_scene(name)
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(MEDIA_DIR),
+        "quality": build.quality_name(quality),
+        # Eviction is by size and recency here, not manim's per-directory file count.
+        "max_files_cached": -1,
+        **config_overrides,
+    }
+    with tempconfig(options):
+        instance = enable_static_holds(build.load_scene_class(scene)())
+        if stream:
+            from streaming import enable_streaming
+
+            enable_streaming(instance)
+        instance.render()
+        record_usage(scene, quality, instance.renderer.file_writer.partial_movie_files)
+    return scene
+
+
+def _last_used():
+    """``{partial path: last time a recorded render used it}``, plus the pinned set."""
+    last_used = {}
+    pinned = set()
+    for usage_file in USAGE_DIR.glob("*.json"):
+        usage = json.loads(usage_file.read_text())
+        for path in usage["files"]:
+            last_used[path] = max(last_used.get(path, 0), usage["rendered_at"])
+            pinned.add(path)
+    return last_used, pinned
+
+
+def partial_files(media_dir=MEDIA_DIR):
+    return [
+        path
+        for path in (Path(media_dir) / "videos").glob("*/*/partial_movie_files/*/*")
+        if path.is_file() and path.suffix in (".mp4", ".mov", ".webm")
+    ]
+
+
+def evict(max_size=DEFAULT_MAX_SIZE, media_dir=MEDIA_DIR, dry_run=False):
+    """Delete least-recently-used unpinned partials until the cache is at most ``max_size`` bytes.
+
+    Partials no recorded render has used fall back to their mtime, so stale
+    files from before this cache existed go first.  Returns the deleted paths.
+    """
+    last_used, pinned = _last_used()
+    files = []
+    for path in partial_files(media_dir):
+        stat = path.stat()
+        key = str(path.resolve())
+        files.append((last_used.get(key, stat.st_mtime), stat.st_size, key, path))
+
+    total = sum(size for _, size, _, _ in files)
+    deleted = []
+    for _, size, key, path in sorted(files):
+        if total <= max_size:
+            break
+        if key in pinned:
+            continue
+        if not dry_run:
+            path.unlink()
+        total -= size
+        deleted.append(path)
+    return deleted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = commands.add_parser("render", help="render a scene and record its partials")
+    render_parser.add_argument("scene")
+    render_parser.add_argument("-q", "--quality", default="l")
+    render_parser.add_argument("--no_latex_cleanup", action="store_true")
+    render_parser.add_argument(
+        "--stream", action="store_true", help="one encoder for the whole scene"
+    )
+
+    evict_parser = commands.add_parser("evict", help="trim the partial movie cache")
+    evict_parser.add_argument("--max-size", type=parse_size, default=DEFAULT_MAX_SIZE)
+    evict_parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    if args.command == "render":
+        overrides = {"no_latex_cleanup": True} if args.no_latex_cleanup else {}
+        render(args.scene, args.quality, args.stream, **overrides)
+    else:
+        deleted = evict(args.max_size, dry_run=args.dry_run)
+        freed = sum(path.stat().st_size for path in deleted) if args.dry_run else None
+        for path in deleted:
+            print(f"{'would evict' if args.dry_run else 'evicted'} {path}")
+        if freed is not None:
+            print(f"{freed / 1024 ** 2:.1f} MiB would be freed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+from manim import *
+import numpy as np
+
+from vectorized import apply_frame, axes_frame, quad_bezier_points
+
+
+class RevolvedSurface(VGroup):
+    """Surface swept by revolving ``y = func(x)`` about the x-axis of ``axes``.
+
+    The full ``0..TAU`` vertex grid is built once as an array.  ``set_angle``
+    only changes which columns of faces are shown and trims the leading
+    column to the requested angle, so a sweep never rebuilds the mesh.
+    """
+
+    def __init__(
+        self,
+        axes,
+        func,
+        u_range=(0, 1),
+        resolution=(30, 30),
+        angle=TAU,
+        fill_color=BLUE_D,
+        fill_opacity=1.0,
+        checkerboard_colors=[BLUE_D, BLUE_E],
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if isinstance(resolution, int):
+            resolution = (resolution, resolution)
+        self.u_res, self.v_res = resolution
+        self.u_range = u_range
+
+        self.frame = axes_frame(axes)
+        self.u_values = np.linspace(*u_range, self.u_res + 1)
+        self.v_values = np.linspace(0, TAU, self.v_res + 1)
+        self.radii = np.asarray(func(self.u_values), dtype=float) * np.ones_like(self.u_values)
+
+        # grid[i, j] is the vertex at u_values[i], v_values[j]
+        self.grid = self._ring(self.v_values[None, :])
+
+        corners = np.stack([
+            self.grid[:-1, :-1],
+            self.grid[1:, :-1],
+            self.grid[1:, 1:],
+            self.grid[:-1, 1:],
+        ], axis=2)
+        # Column-major (v outer) so the faces shown at any angle are a prefix.
+        all_points = quad_bezier_points(corners.transpose(1, 0, 2, 3))
+
+        self.faces = []
+        for j in range(self.v_res):
+            for i in range(self.u_res):
+                face = ThreeDVMobject()
+                face.set_points(all_points[j, i])
+                face.u_index = i
+                face.v_index = j
+                self.faces.append(face)
+
+        faces = VGroup(*self.faces)
+        faces.set_fill(color=fill_color, opacity=fill_opacity)
+        faces.set_stroke(color=stroke_color, width=stroke_width)
+        if checkerboard_colors:
+            n_colors = len(checkerboard_colors)
+            for face in self.faces:
+                face.set_fill(checkerboard_colors[(face.u_index + face.v_index) % n_colors])
+
+        self.angle = None
+        self._trimmed = None
+        self.set_angle(angle)
+
+    def _ring(self, v):
+        # v broadcasts against the u samples along the first axis
+        r = self.radii[:, None]
+        return apply_frame(self.frame, self.u_values[:, None], r * np.cos(v), r * np.sin(v))
+
+    def _set_column(self, j, far_edge):
+        corners = np.stack([
+            self.grid[:-1, j],
+            self.grid[1:, j],
+            far_edge[1:],
+            far_edge[:-1],
+        ], axis=1)
+        column = self.faces[j * self.u_res:(j + 1) * self.u_res]
+        for face, face_points in zip(column, quad_bezier_points(corners)):
+            face.set_points(face_points)
+
+    def set_angle(self, angle):
+        angle = float(np.clip(angle, 0, TAU))
+        if angle == self.angle:
+            return self
+        self.angle = angle
+
+        step = TAU / self.v_res
+        full_columns = min(int(angle // step), self.v_res)
+        partial = full_columns < self.v_res and angle - full_columns * step > 1e-9
+        trimmed = full_columns if partial else None
+
+        # Only the column a previous call trimmed has to be restored.
+        if self._trimmed is not None and self._trimmed != trimmed:
+            self._set_column(self._trimmed, self.grid[:, self._trimmed + 1])
+        if partial:
+            self._set_column(full_columns, self._ring(np.array([[angle]]))[:, 0])
+        self._trimmed = trimmed
+
+        shown = (full_columns + partial) * self.u_res
+        self.submobjects = self.faces[:shown]
+        return self
+
+    def get_angle(self):
+        return self.angle
+
+
+class DiskStack(VGroup):
+    """Disk-method (or washer-method) slabs for the solid swept by ``func``.
+
+    The ``x_range`` is cut into ``count`` slabs of radius ``func`` sampled at
+    each slab's ``sample`` point (``"left"``, ``"mid"`` or ``"right"``), with
+    ``inner_func`` hollowing them into washers.  All slabs live in one
+    vertex buffer built in a single vectorized pass: every slab is a few
+    segments of the profile in the ``(x, r)`` half-plane, revolved into one
+    quad per angular sector.  Each quad is its own :class:`ThreeDVMobject`,
+    so it is depth-sorted, shaded and filled on its own, but its points are
+    a view into the buffer: ``set_count`` refills the buffer in place, for a
+    tracker-driven refinement like ``RiemannStrips.set_dx``, and only swaps
+    which quads are shown.
+
+    ``set_count`` and ``get_slab`` build from ``axes`` coordinates, so they
+    do not support transforms of the stack itself: after a shift, rotation
+    or scale, the next ``set_count`` puts the slabs back on the axes and
+    ``get_slab`` returns a slab there.  Move the axes and rebuild instead.
+    """
+
+    def __init__(
+        self,
+        axes,
+        func,
+        x_range=(0, 1),
+        count=50,
+        inner_func=None,
+        sample="mid",
+        resolution=24,
+        max_count=None,
+        fill_color=RED_D,
+        fill_opacity=0.85,
+        checkerboard_colors=[RED_D, RED_E],
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.frame = axes_frame(axes)
+        self.func = func
+        self.inner_func = inner_func
+        self.x_min, self.x_max = x_range[:2]
+        self.sample = sample
+        self.v_res = resolution
+        self.v_values = np.linspace(0, TAU, resolution + 1)
+        self.count = None
+
+        # sectors[j][q] is quad q of angular sector j.
+        self.sectors = [[ThreeDVMobject()] for _ in range(resolution)]
+        sector_styles = VGroup(*(sector[0] for sector in self.sectors))
+        sector_styles.set_fill(color=fill_color, opacity=fill_opacity)
+        sector_styles.set_stroke(color=stroke_color, width=stroke_width)
+        if checkerboard_colors:
+            for j, sector in enumerate(self.sectors):
+                sector[0].set_fill(checkerboard_colors[j % len(checkerboard_colors)])
+        self._allocate(max(count, max_count or count))
+        self.set_count(count)
+
+    def _quads_per_sector(self, count):
+        # outer bands and the steps between them, plus inner bands and steps for washers
+        quads = 2 * count + 1
+        if self.inner_func is not None:
+            quads += 2 * count - 1
+        return quads
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        quads = self._quads_per_sector(capacity)
+        self._buffer = np.empty((self.v_res, quads, 16, 3))
+        for sector in self.sectors:
+            # New quads take their sector's style; existing ones keep theirs.
+            for _ in range(quads - len(sector)):
+                sector.append(ThreeDVMobject().match_style(sector[0]))
+
+    def _radii(self, x):
+        outer = np.abs(np.asarray(self.func(x), dtype=float)) * np.ones_like(x)
+        if self.inner_func is None:
+            return outer, np.zeros_like(x)
+        inner = np.abs(np.asarray(self.inner_func(x), dtype=float)) * np.ones_like(x)
+        return outer, inner
+
+    def _revolve(self, seg_x, seg_r):
+        """Revolve profile segments ``(Q, 2)`` into ``(sectors, Q, 16, 3)`` bezier points."""
+        order = [0, 1, 1, 0]
+        v = self.v_values
+        angles = np.stack([v[:-1], v[:-1], v[1:], v[1:]], axis=-1)[:, None, :]
+        x = seg_x[None, :, order]
+        r = seg_r[None, :, order]
+        corners = apply_frame(self.frame, x, r * np.cos(angles), r * np.sin(angles))
+        return quad_bezier_points(corners)
+
+    def set_count(self, count):
+        """Rebuild the stack with ``count`` slabs, in place when it fits the buffer."""
+        count = max(int(count), 1)
+        if count == self.count:
+            return self
+        self.count = count
+        if count > self.capacity:
+            self._allocate(max(count, 2 * self.capacity))
+
+        edges = np.linspace(self.x_min, self.x_max, count + 1)
+        x = {
+            "left": edges[:-1],
+            "right": edges[1:],
+            "mid": (edges[:-1] + edges[1:]) / 2,
+        }[self.sample]
+        outer, inner = self._radii(x)
+        self.edges, self.sample_x = edges, x
+        self.outer_radii, self.inner_radii = outer, inner
+
+        # Outer band of each slab, then the step at each edge (the end caps reach the inner radius).
+        left, right = edges[:-1], edges[1:]
+        step_from = np.concatenate([inner[:1], outer])
+        step_to = np.concatenate([outer, inner[-1:]])
+        seg_x = [np.stack([left, right], -1), np.stack([edges, edges], -1)]
+        seg_r = [np.stack([outer, outer], -1), np.stack([step_from, step_to], -1)]
+        if self.inner_func is not None:
+            seg_x += [np.stack([left, right], -1), np.stack([edges[1:-1], edges[1:-1]], -1)]
+            seg_r += [np.stack([inner, inner], -1), np.stack([inner[:-1], inner[1:]], -1)]
+        points = self._revolve(np.concatenate(seg_x), np.concatenate(seg_r))
+
+        quads = points.shape[1]
+        self._buffer[:, :quads] = points
+        shown = []
+        for j, sector in enumerate(self.sectors):
+            # Rebinding is cheap, and it reattaches quads a transform gave arrays of their own.
+            for q, face in enumerate(sector[:quads]):
+                face.points = self._buffer[j, q]
+            shown += sector[:quads]
+        self.submobjects = shown
+        return self
+
+    def get_count(self):
+        return self.count
+
+    def volume(self):
+        """The Riemann estimate ``sum(pi * (R^2 - r^2) * dx)`` of the solid's volume."""
+        dx = (self.x_max - self.x_min) / self.count
+        return float(np.pi * np.sum(self.outer_radii ** 2 - self.inner_radii ** 2) * dx)
+
+    def get_slab(self, index):
+        """Slab ``index`` as its own closed solid, styled like the stack, e.g. to highlight it."""
+        x0, x1 = self.edges[index], self.edges[index + 1]
+        outer, inner = self.outer_radii[index], self.inner_radii[index]
+        seg_x = np.array([[x0, x1], [x0, x0], [x1, x1], [x0, x1]])
+        seg_r = np.array([[outer, outer], [inner, outer], [inner, outer], [inner, inner]])
+        if self.inner_func is None:
+            seg_x, seg_r = seg_x[:3], seg_r[:3]
+        points = self._revolve(seg_x, seg_r)
+        slab = VGroup()
+        for j, sector in enumerate(self.sectors):
+            for quad_points in points[j]:
+                face = ThreeDVMobject()
+                face.points = quad_points
+                slab.add(face.match_style(sector[0]))
+        return slab
@@ -1,7 +1,13 @@
 from manim import *
 import numpy as np
 
-class RevolveSurface(ThreeDScene):
+from depth_sort import DepthSortScene
+from revolution import RevolvedSurface
+from vectorized import VectorizedParametricFunction, VectorizedSurface, batch_c2p
+
+class RevolveSurface(DepthSortScene):
+    resolution = (30, 30)
+
     def construct(self):
         axes = ThreeDAxes(
             x_range=[0, 5, 1],
@@ -29,8 +35,8 @@ class RevolveSurface(ThreeDScene):
         def func(x):
             return 0.25 * (x - 1) * (x - 3) * (x - 4) + 3
         
-        curve_3d = ParametricFunction(
-            lambda t: axes.c2p(t, func(t), 0),
+        curve_3d = VectorizedParametricFunction(
+            lambda t: batch_c2p(axes, t, func(t), 0),
             t_range=[0, 4],
             color=YELLOW,
             use_smoothing=True,
@@ -41,18 +47,16 @@ class RevolveSurface(ThreeDScene):
         self.move_camera(phi=45 * DEGREES, theta=-45 * DEGREES, run_time=2)
 
         angle_tracker = ValueTracker(0)
-        surface = always_redraw(lambda: Surface(
-            lambda u, v: axes.c2p(
-                u,
-                func(u) * np.cos(v),
-                func(u) * np.sin(v)
-            ),
+        surface = RevolvedSurface(
+            axes,
+            func,
             u_range=[0, 4],
-            v_range=[0, angle_tracker.get_value()],
-            resolution=(30, 30),
+            resolution=self.resolution,
+            angle=0,
             fill_opacity=0.4,
             checkerboard_colors=[BLUE_D, BLUE_E]
-        ))
+        )
+        surface.add_updater(lambda m: m.set_angle(angle_tracker.get_value()))
 
         self.add(surface)
 
@@ -70,8 +74,9 @@ class RevolveSurface(ThreeDScene):
         radius = func(x_val)
         thickness = 0.10
 
-        disc = Surface(
-            lambda u, v: axes.c2p(
+        disc = VectorizedSurface(
+            lambda u, v: batch_c2p(
+                axes,
                 x_val,
                 (radius - thickness) * np.cos(u) + v * np.cos(u),
                 (radius - thickness) * np.sin(u) + v * np.sin(u)
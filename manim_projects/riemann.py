@@ -0,0 +1,177 @@
+from manim import *
+import numpy as np
+
+from vectorized import axes_frame
+
+# Bezier points of one strip outline as fractions of (dx, height), walking the
+# corners in Rectangle's order UR, UL, DL, DR with the handles at thirds.
+_CORNER_DX = np.array([1, 0, 0, 1, 1])
+_CORNER_DY = np.array([1, 1, 0, 0, 1])
+_THIRDS = np.linspace(0, 1, 4)
+_DX_WEIGHTS = _CORNER_DX[:-1, None] + np.outer(np.diff(_CORNER_DX), _THIRDS)
+_DY_WEIGHTS = _CORNER_DY[:-1, None] + np.outer(np.diff(_CORNER_DY), _THIRDS)
+
+
+class RiemannStrips(VMobject):
+    """Left-endpoint strips between ``f`` and ``g`` on ``[a, b)``, as one VMobject.
+
+    All strip corners are computed in one vectorized pass and stored as
+    subpaths of a single point array.  ``set_dx`` refills that array in
+    place, so a ``dx`` sweep only allocates when it outgrows ``min_dx``.
+    Indexing gives back a standalone :class:`Rectangle` for one strip, so
+    ``strips[i]`` can be copied, moved or braced like a rectangle from a
+    ``VGroup``; it is cut from the current points, so it follows any
+    transform applied to the strips.  ``set_dx`` rebuilds from ``axes``,
+    which undoes such transforms.
+    """
+
+    def __init__(
+        self,
+        axes,
+        f,
+        g,
+        a,
+        b,
+        dx,
+        min_dx=None,
+        fill_color=YELLOW,
+        fill_opacity=0.75,
+        stroke_color=BLACK,
+        stroke_width=1,
+        **kwargs,
+    ):
+        self.frame = axes_frame(axes)
+        self.f = f
+        self.g = g
+        self.a = a
+        self.b = b
+        self.dx = dx
+        self._allocate(self._count(min(dx, min_dx or dx)))
+        super().__init__(
+            fill_color=fill_color,
+            fill_opacity=fill_opacity,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            **kwargs,
+        )
+
+    def _count(self, dx):
+        # Same count as np.arange(a, b, dx)
+        return max(int(np.ceil((self.b - self.a) / dx)), 0)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self._index = np.arange(capacity, dtype=float)
+        self._x = np.empty(capacity)
+        self._tops = np.empty(capacity)
+        self._bottoms = np.empty(capacity)
+        self._heights = np.empty(capacity)
+        self._xs = np.empty((capacity, 4, 4))
+        self._ys = np.empty((capacity, 4, 4))
+        self._scratch = np.empty((capacity, 4, 4))
+        self._buffer = np.empty((capacity * 16, 3))
+
+    def generate_points(self):
+        return self.set_dx(self.dx, force=True)
+
+    def set_dx(self, dx, force=False):
+        """Refill the strips for a new ``dx`` inside the preallocated buffers.
+
+        Buffers only grow when ``dx`` needs more strips than ``min_dx`` allowed for.
+        """
+        if dx == self.dx and not force:
+            return self
+        self.dx = dx
+        n = self._count(dx)
+        if n > self.capacity:
+            self._allocate(max(n, 2 * self.capacity))
+
+        x = self._x[:n]
+        np.multiply(self._index[:n], dx, out=x)
+        x += self.a
+        self._tops[:n] = self.f(x)
+        self._bottoms[:n] = self.g(x)
+        np.subtract(self._tops[:n], self._bottoms[:n], out=self._heights[:n])
+        self.x_values = x
+        self.tops = self._tops[:n]
+        self.bottoms = self._bottoms[:n]
+
+        # Coordinates of every bezier point: x + dx * _DX_WEIGHTS, bottom + height * _DY_WEIGHTS
+        xs = self._xs[:n]
+        ys = self._ys[:n]
+        scratch = self._scratch[:n]
+        np.add(x[:, None, None], dx * _DX_WEIGHTS, out=xs)
+        np.multiply(self._heights[:n, None, None], _DY_WEIGHTS, out=ys)
+        ys += self.bottoms[:, None, None]
+
+        origin, basis = self.frame
+        points = self._buffer[:n * 16].reshape(n, 4, 4, 3)
+        for c in range(3):
+            np.multiply(xs, basis[0][c], out=points[..., c])
+            np.multiply(ys, basis[1][c], out=scratch)
+            points[..., c] += scratch
+            points[..., c] += origin[c]
+        self.points = self._buffer[:n * 16]
+        return self
+
+    def get_strip(self, index):
+        # Each strip is one 16-point subpath, laid out like Rectangle's.
+        rect = Rectangle()
+        rect.points = self.points[16 * index:16 * (index + 1)].copy()
+        rect.match_style(self)
+        return rect
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VGroup(*(self.get_strip(i) for i in range(len(self))[index]))
+        if index < 0:
+            index += len(self)
+        return self.get_strip(index)
+
+    def __iter__(self):
+        return (self.get_strip(i) for i in range(len(self)))
+
+    def __len__(self):
+        return len(self.x_values)
+
+
+class GrowStripsFromEdge(Animation):
+    """Grow each strip of a :class:`RiemannStrips` from ``edge``, one after another.
+
+    This is the single-``play`` equivalent of playing ``GrowFromEdge`` on every
+    strip with ``run_time=time_per_strip``: strip ``i`` grows during exactly
+    ``[i, i + 1] * time_per_strip`` seconds, eased by ``strip_rate_func``.
+    """
+
+    def __init__(
+        self,
+        strips,
+        edge=LEFT,
+        time_per_strip=0.05,
+        strip_rate_func=smooth,
+        **kwargs,
+    ):
+        self.edge = edge
+        self.strip_rate_func = strip_rate_func
+        kwargs.setdefault("run_time", time_per_strip * max(len(strips), 1))
+        kwargs.setdefault("rate_func", linear)
+        kwargs.setdefault("introducer", True)
+        super().__init__(strips, **kwargs)
+
+    def begin(self):
+        self.strip_points = self.mobject.points.reshape(-1, 16, 3).copy()
+        mins = self.strip_points.min(axis=1)
+        maxs = self.strip_points.max(axis=1)
+        self.pivots = (mins + maxs) / 2 + self.edge * (maxs - mins) / 2
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        n = len(self.strip_points)
+        progress = alpha * n
+        done = min(int(progress), n)
+        points = self.strip_points[:min(done + 1, n)].copy()
+        if done < n:
+            scale = self.strip_rate_func(progress - done)
+            pivot = self.pivots[done]
+            points[done] = pivot + scale * (points[done] - pivot)
+        self.mobject.points = points.reshape(-1, 3)
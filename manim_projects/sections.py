@@ -0,0 +1,157 @@
+"""Render the sections of one long scene in parallel and join them losslessly.
+
+Scenes mark their phases with ``self.next_section("name")``.  A quick
+dry run counts the plays in each section; then every section is rendered
+in its own process with manim's animation range
+(``from_animation_number``/``upto_animation_number``).  manim only stops
+writing the earlier plays, so they are also kept from drawing, which
+fast-forwards them to their end state at the cost of ``construct``
+alone.  The section videos share encoder settings, so ffmpeg's concat
+demuxer joins them without re-encoding::
+
+    python sections.py LimitAtInfinity -j 4
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build import MEDIA_DIR, find_scene, load_scene_class, quality_name
+from timeline import skip_rasterizing
+
+
+def _scene_config(scene, quality, **overrides):
+    return {
+        "input_file": str(scene.path),
+        "media_dir": str(MEDIA_DIR),
+        "quality": quality_name(quality),
+        "no_latex_cleanup": True,
+        **overrides,
+    }
+
+
+def count_section_plays(scene, quality="l"):
+    """Run ``construct`` without rendering and return ``[(name, first_play, end_play)]``."""
+    from manim import tempconfig
+
+    with tempconfig(_scene_config(scene, quality, dry_run=True, disable_caching=True)):
+        instance = skip_rasterizing(load_scene_class(scene)(skip_animations=True))
+        instance.skip_animation_preview = True
+        starts = [("start", 0)]
+        next_section = instance.next_section
+
+        def record(name="unnamed", *args, **kwargs):
+            starts.append((name, instance.renderer.num_plays))
+            return next_section(name, *args, **kwargs)
+
+        instance.next_section = record
+        instance.render()
+        total = instance.renderer.num_plays
+
+    bounds = [start for _, start in starts[1:]] + [total]
+    sections = [
+        (name, start, end)
+        for (name, start), end in zip(starts, bounds)
+        if end > start
+    ]
+    return sections
+
+
+def _render_range(scene, quality, index, name, start, end, output_file=None):
+    from manim import tempconfig
+
+    from holds import enable_static_holds
+
+    output_file = output_file or f"{scene.name}_section{index:02d}_{name}"
+    overrides = {
+        "from_animation_number": start,
+        "upto_animation_number": end - 1,
+        "output_file": output_file,
+        # Each worker gets its own partial movie dir so their segment lists don't mix.
+        "partial_movie_dir": str(
+            MEDIA_DIR / "sections" / scene.module / scene.name / f"{index:02d}"
+        ),
+    }
+    with tempconfig(_scene_config(scene, quality, **overrides)):
+        instance = skip_rasterizing(enable_static_holds(load_scene_class(scene)()))
+        instance.render()
+        return Path(instance.renderer.file_writer.movie_file_path)
+
+
+def render_from_section(scene, names, quality="l"):
+    """Render ``scene`` from the first of the sections ``names`` to its end, as one video.
+
+    Plays before that section are fast-forwarded without drawing, and
+    every later section is rendered too, since it may build on what the
+    changed one set up.  Returns ``(section, video path)``, or ``None``
+    when none of ``names`` has any plays.
+    """
+    sections = count_section_plays(scene, quality)
+    for index, (name, start, _) in enumerate(sections):
+        if name in names:
+            output_file = f"{scene.name}_from_section{index:02d}_{name}"
+            end = sections[-1][2]
+            return name, _render_range(scene, quality, index, name, start, end, output_file)
+    return None
+
+
+def join_videos(parts, output):
+    """Concatenate videos with identical encoder settings without re-encoding."""
+    output = Path(output)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for part in parts:
+            listing.write(f"file '{Path(part).resolve().as_posix()}'\n")
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0",
+                "-i", listing.name,
+                "-c", "copy",
+                "-movflags", "+faststart",
+                str(output),
+            ],
+            check=True,
+        )
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def render_sections(name, quality="l", jobs=None, keep_parts=False):
+    """Render scene ``name`` section-parallel; returns the joined video path."""
+    scene = find_scene(name)
+    sections = count_section_plays(scene, quality)
+    print(f"{scene}: " + ", ".join(f"{n} [{s}, {e})" for n, s, e in sections))
+
+    with ProcessPoolExecutor(max_workers=jobs or min(len(sections), os.cpu_count())) as pool:
+        futures = [
+            pool.submit(_render_range, scene, quality, index, section, start, end)
+            for index, (section, start, end) in enumerate(sections)
+        ]
+        parts = [future.result() for future in futures]
+
+    output = join_videos(parts, scene.output(quality))
+    if not keep_parts:
+        for part in parts:
+            part.unlink()
+        shutil.rmtree(MEDIA_DIR / "sections" / scene.module / scene.name, ignore_errors=True)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="l")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("--keep-parts", action="store_true")
+    args = parser.parse_args()
+    print(render_sections(args.scene, args.quality, args.jobs, args.keep_parts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Encode a whole scene through one encoder instead of one partial movie per play.
+
+By default every ``play``/``wait`` opens its own encoder and writes its own
+file under ``partial_movie_files/``, and the scene's movie is a concat of
+those files.  ``StreamingFileWriter`` keeps a single encoder open for the
+whole ``construct`` and writes the movie directly.  Next to the movie it
+writes ``<scene>.plays.json`` with each play's cache hash and frame range::
+
+    {"fps": 15, "frames": 912, "plays": [{"index": 0, "hash": "...", "start": 0, "frames": 15}, ...]}
+
+Plays that manim finds in its partial movie cache are decoded from that
+file into the stream, so earlier per-play renders keep paying off.  Every
+play starts on a keyframe, so once the stream is done the packets of the
+plays it rendered are copied into their partial files, and the next run
+finds them cached whether it streams or not.  Sound, ``--save_sections``
+and GIF output are left to manim, which joins those partials as usual.
+``play_window`` turns the frame ranges back into timestamps for seeking
+into the movie.
+"""
+
+import json
+import shutil
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+from manim.scene.scene_file_writer import SceneFileWriter, _PartialMovieEncodeJob
+
+from holds import StaticHoldEncoder
+
+
+def plays_file(movie):
+    return Path(movie).with_suffix(".plays.json")
+
+
+class StreamEncoder(StaticHoldEncoder):
+    """:class:`StaticHoldEncoder` that encodes the frames at ``keyframes`` as keyframes.
+
+    With closed GOPs (x264's default) no frame refers across a keyframe, so
+    the stream can be cut there without re-encoding.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.keyframes = set()
+
+    def write_frame(self, pixels, *, repeat=1):
+        if self._next_pts not in self.keyframes:
+            return super().write_frame(pixels, repeat=repeat)
+        import av
+
+        self._validate_frame(pixels, repeat)
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+        frame.pts = self._next_pts
+        frame.time_base = Fraction(self.spec.frame_rate.denominator, self.spec.frame_rate.numerator)
+        frame.pict_type = av.video.frame.PictureType.I
+        self._next_pts += 1
+        for packet in self._stream.encode(frame):
+            self._container.mux(packet)
+        if repeat > 1:
+            super().write_frame(pixels, repeat=repeat - 1)
+
+
+class StreamingFileWriter(SceneFileWriter):
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.stream_job = None
+        self.stream_encoder = None
+        self.stream_frames = 0
+        self.keyframes = set()
+        self.plays = []
+        # (play, partial file) of the plays encoded into the stream, not read from the cache
+        self.rendered = []
+
+    @property
+    def stream_path(self):
+        movie = self.movie_file_path
+        return movie.with_name(f"{movie.stem}_stream{movie.suffix}")
+
+    def _stream(self):
+        if self.stream_job is None:
+            self.stream_encoder = StreamEncoder(
+                target=self.stream_path,
+                spec=self.video_encoder,
+                gaps=not self.output_spec.is_gif,
+            )
+            self.stream_encoder.keyframes = self.keyframes
+            self.stream_job = _PartialMovieEncodeJob(
+                animation_index=0,
+                encoder=self.stream_encoder,
+                frame_queue_size=self.settings.encoder_queue_size,
+            )
+        return self.stream_job
+
+    def _put(self, pixels, repeat=1):
+        self._stream().put(repeat, pixels)
+        self.stream_frames += repeat
+
+    def _stream_cached(self, path):
+        """Copy a cached partial into the stream, holds included.
+
+        :class:`holds.StaticHoldEncoder` stores a hold as one frame and a gap
+        in the timestamps, so each frame repeats until the next one's
+        timestamp, and the last one until the end of the segment.
+        """
+        import av
+
+        fps = self.video_encoder.frame_rate
+        with av.open(str(path)) as container:
+            stream = container.streams.video[0]
+            previous = None
+            for frame in container.decode(stream):
+                index = round(frame.pts * frame.time_base * fps)
+                if previous is not None:
+                    self._put(previous[1], max(1, index - previous[0]))
+                # Decoded rows can be padded; the encoder only takes contiguous frames.
+                previous = (index, np.ascontiguousarray(frame.to_ndarray(format="rgba")))
+            if previous is not None:
+                end = previous[0] + 1
+                if stream.duration is not None:
+                    start = stream.start_time or 0
+                    end = max(end, round((start + stream.duration) * stream.time_base * fps))
+                self._put(previous[1], end - previous[0])
+
+    def begin_animation(self, allow_write=False, *, animation_index, file_path=None):
+        if not self.output_spec.is_video:
+            return super().begin_animation(
+                allow_write, animation_index=animation_index, file_path=file_path
+            )
+        partial = self.partial_movie_files[animation_index]
+        self.plays.append(
+            {
+                "index": animation_index,
+                "hash": Path(partial).stem if partial else None,
+                "start": self.stream_frames,
+            }
+        )
+        # The play's frames are queued after this, so the encoder thread sees it in time.
+        self.keyframes.add(self.stream_frames)
+        if allow_write and partial:
+            self.rendered.append((self.plays[-1], Path(partial)))
+        # A play that isn't written but has a hash was found in the partial movie cache.
+        elif partial and Path(partial).exists():
+            self._stream_cached(partial)
+
+    def _write_partials(self):
+        """Copy the packets of each play in ``rendered`` from the stream into its partial file.
+
+        Each packet is written once the next one of its play arrives, so the
+        last one can be stretched to the play's end: the stream's decode
+        timestamps put a hold's gap after the B-frame delay, in the next play.
+        """
+        import av
+
+        fps = self.video_encoder.frame_rate
+        pending = sorted(self.rendered, key=lambda item: item[0]["start"])
+        outputs = {}
+
+        def frames_to_ticks(frames, stream):
+            return round(frames / fps / stream.time_base)
+
+        with av.open(str(self.stream_path)) as stream_input:
+            stream = stream_input.streams.video[0]
+            for packet in stream_input.demux(stream):
+                if packet.dts is None:
+                    continue
+                index = round(packet.pts * stream.time_base * fps)
+                for play, path in pending:
+                    if play["start"] <= index < play["start"] + play["frames"]:
+                        break
+                else:
+                    continue
+                if path not in outputs:
+                    if not packet.is_keyframe:
+                        raise RuntimeError(f"play {play['index']} does not start on a keyframe")
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    temp = path.with_name(f"{path.stem}.tmp{path.suffix}")
+                    output = av.open(str(temp), mode="w")
+                    outputs[path] = {
+                        "temp": temp,
+                        "container": output,
+                        "stream": output.add_stream_from_template(template=stream),
+                        "offset": frames_to_ticks(play["start"], stream),
+                        "end": frames_to_ticks(play["frames"], stream),
+                        "first_dts": packet.dts - frames_to_ticks(play["start"], stream),
+                        "held": None,
+                    }
+                target = outputs[path]
+                packet.pts -= target["offset"]
+                packet.dts -= target["offset"]
+                packet.stream = target["stream"]
+                if target["held"] is not None:
+                    target["container"].mux(target["held"])
+                target["held"] = packet
+
+        for path, target in outputs.items():
+            held = target["held"]
+            # The muxer counts a track from its first decode timestamp to the last one's end.
+            held.duration = max(held.duration, target["end"] - (held.dts - target["first_dts"]))
+            target["container"].mux(held)
+            target["container"].close()
+            target["temp"].replace(path)
+
+    def end_animation(self, allow_write=False):
+        if not self.output_spec.is_video:
+            return super().end_animation(allow_write)
+        play = self.plays[-1]
+        play["frames"] = self.stream_frames - play["start"]
+
+    def write_frame(self, pixels, *, repeat=1):
+        if not self.output_spec.is_video:
+            return super().write_frame(pixels, repeat=repeat)
+        self._put(pixels, repeat)
+
+    def finish(self):
+        if not self.output_spec.is_video:
+            return super().finish()
+        if self.stream_job is None:
+            return
+        self.stream_job.seal()
+        self.stream_job.join()
+        self._write_partials()
+        movie = self.movie_file_path
+        if self.includes_sound or self.output_spec.save_sections or self.output_spec.is_gif:
+            # Every play now has its partial file, so manim can join them with these.
+            self.stream_path.unlink()
+            super().finish()
+        else:
+            movie.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(self.stream_path), str(movie))
+            if self.subcaptions:
+                self.write_subcaption_file()
+            self.print_file_ready_message(str(movie))
+        plays_file(movie).write_text(
+            json.dumps(
+                {
+                    "fps": float(self.video_encoder.frame_rate),
+                    "frames": self.stream_frames,
+                    "plays": self.plays,
+                },
+                indent=2,
+            )
+        )
+
+    def abort_encode_jobs(self, reraise_encoder_failures=False):
+        if self.stream_job is not None:
+            self.stream_job.abort()
+            self.stream_job.thread.join()
+            self.stream_job = None
+        super().abort_encode_jobs(reraise_encoder_failures)
+
+
+def enable_streaming(scene):
+    """Swap ``scene``'s file writer for a :class:`StreamingFileWriter`; call before ``render``."""
+    renderer = scene.renderer
+    renderer.file_writer = StreamingFileWriter(renderer.file_writer.settings)
+    return scene
+
+
+def play_window(movie, first, end=None):
+    """``(start, duration)`` in seconds of plays ``[first, end)`` of a streamed ``movie``."""
+    timeline = json.loads(plays_file(movie).read_text())
+    plays = timeline["plays"][first:end]
+    start = plays[0]["start"]
+    frames = plays[-1]["start"] + plays[-1]["frames"] - start
+    return start / timeline["fps"], frames / timeline["fps"]
@@ -1,7 +1,12 @@
 from manim import *
 import numpy as np
 
+from riemann import GrowStripsFromEdge, RiemannStrips
+from vectorized import adaptive_plot
+
 class Testing(Scene):
+    dx = 0.15
+
     def construct(self):
         axes = Axes(
             x_range=[0, PI, 1],
@@ -15,8 +20,8 @@ class Testing(Scene):
         f = lambda x: np.sin(x) + 2
         g = lambda x: np.cos(x) + 1
 
-        f_graph = axes.plot(f, color=BLUE)
-        g_graph = axes.plot(g, color=GREEN)
+        f_graph = adaptive_plot(axes, f, color=BLUE)
+        g_graph = adaptive_plot(axes, g, color=GREEN)
 
         f_label = MathTex("f(x)", color=BLUE).next_to(axes.c2p(PI * 0.75, f(PI * 0.75)), UP + RIGHT, buff=0.4)
         g_label = MathTex("g(x)", color=GREEN).next_to(axes.c2p(PI * 0.25, g(PI * 0.25)), DOWN + LEFT, buff=0.4)
@@ -49,32 +54,10 @@ class Testing(Scene):
         self.play(Create(b_line), Write(b_label))
         self.wait(1)
 
-        dx = 0.15
-        x_vals = np.arange(a, b, dx)
-        rectangles = VGroup()
-
-        for x in x_vals:
-            top = f(x)
-            bottom = g(x)
-            height = top - bottom
-
-            rect_width = axes.c2p(dx, 0)[0] - axes.c2p(0, 0)[0]
-            rect_height = axes.c2p(0, height)[1] - axes.c2p(0, 0)[1]
-
-            rect = Rectangle(
-                width=rect_width,
-                height=rect_height,
-                fill_opacity=0.75,
-                fill_color=YELLOW,
-                stroke_color=BLACK,
-                stroke_width=1,
-            )
-
-            rect.move_to(axes.c2p(x + dx / 2, g(x) + height / 2))
-            rectangles.add(rect)
+        dx = self.dx
+        rectangles = RiemannStrips(axes, f, g, a, b, dx)
 
-        for rect in rectangles:
-            self.play(GrowFromEdge(rect, edge=LEFT), run_time=0.05)
+        self.play(GrowStripsFromEdge(rectangles, edge=LEFT, time_per_strip=0.05))
 
         self.wait(2)
         self.wait(1)
@@ -99,4 +82,18 @@ class Testing(Scene):
 
         self.play(Create(height_brace), Write(h_label))
         self.play(Create(dx_brace), Write(dx_label))
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+        self.play(FadeOut(rect_copy, height_brace, h_label, dx_brace, dx_label))
+
+        # Refine dx -> 0
+        dx_tracker = ValueTracker(0.5)
+        refining = RiemannStrips(axes, f, g, a, b, dx_tracker.get_value(), min_dx=0.001)
+        # Thin the black outlines with dx so narrow strips stay yellow
+        refining.add_updater(lambda m: m.set_dx(dx_tracker.get_value()).set_stroke(
+            width=min(1, 20 * dx_tracker.get_value())
+        ))
+
+        self.play(FadeOut(rectangles), FadeIn(refining))
+        self.play(dx_tracker.animate.set_value(0.001), run_time=6, rate_func=rate_functions.ease_out_sine)
+        self.wait(2)
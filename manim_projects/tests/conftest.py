@@ -0,0 +1,56 @@
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from build import SceneEntry  # noqa: E402
+
+SCENES = '''
+from manim import *
+
+
+class FourPlays(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Create(square))
+        self.wait()
+        self.next_section("moved")
+        self.play(square.animate.shift(RIGHT))
+        self.wait(2)
+
+
+class WithSound(Scene):
+    def construct(self):
+        from pydub import AudioSegment
+
+        self.renderer.file_writer.add_audio_segment(AudioSegment.silent(duration=1500))
+        self.play(Create(Square()))
+        self.wait()
+'''
+
+
+@pytest.fixture
+def scene_module(tmp_path):
+    """A module with small scenes that need no LaTeX; returns a ``SceneEntry`` factory."""
+    path = tmp_path / "small_scenes.py"
+    path.write_text(textwrap.dedent(SCENES))
+    return lambda name: SceneEntry(name, path)
+
+
+@pytest.fixture
+def count_captures(monkeypatch):
+    """Count every ``Camera.capture_mobjects`` call made while the test runs."""
+    from manim import Camera
+
+    counts = {"captures": 0}
+    capture_mobjects = Camera.capture_mobjects
+
+    def counting(self, *args, **kwargs):
+        counts["captures"] += 1
+        return capture_mobjects(self, *args, **kwargs)
+
+    monkeypatch.setattr(Camera, "capture_mobjects", counting)
+    return counts
@@ -0,0 +1,23 @@
+import numpy as np
+from manim import Square, ThreeDCamera, VGroup
+
+from depth_sort import DepthSortCamera
+
+
+def draw_order(camera, faces):
+    return [faces.submobjects.index(mob) for mob in camera.get_mobjects_to_display([faces])]
+
+
+def test_ties_keep_the_order_faces_were_added_in():
+    faces = VGroup(*(Square(side_length=0.5) for _ in range(6)))
+    for face in faces:
+        face.shade_in_3d = True
+    fast, reference = DepthSortCamera(), ThreeDCamera()
+
+    # Reverse the order for one frame, then put every face at the same depth.
+    for face, z in zip(faces, np.linspace(1, -1, len(faces))):
+        face.move_to([0, 0, z])
+    assert draw_order(fast, faces) == draw_order(reference, faces)
+    for face in faces:
+        face.move_to([0, 0, 0])
+    assert draw_order(fast, faces) == draw_order(reference, faces) == list(range(len(faces)))
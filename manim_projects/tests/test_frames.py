@@ -0,0 +1,31 @@
+from PIL import Image
+
+import frames
+
+
+def test_only_requested_frames_are_drawn(monkeypatch, tmp_path, scene_module, count_captures):
+    monkeypatch.setattr(frames, "MEDIA_DIR", tmp_path / "media")
+    monkeypatch.setattr(frames, "find_scene", scene_module)
+    paths = frames.render_frames("FourPlays", [2.5, 0.5], tmp_path / "frames")
+
+    assert [path.name for path in paths] == ["FourPlays_0002.50s.png", "FourPlays_0000.50s.png"]
+    assert count_captures["captures"] == 2
+
+
+def test_resolution_keeps_the_aspect_ratio(monkeypatch, tmp_path, scene_module):
+    from manim import Camera
+
+    frame_widths = []
+    init = Camera.__init__
+
+    def record(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        frame_widths.append(self.frame_width)
+
+    monkeypatch.setattr(Camera, "__init__", record)
+    monkeypatch.setattr(frames, "MEDIA_DIR", tmp_path / "media")
+    monkeypatch.setattr(frames, "find_scene", scene_module)
+    [path] = frames.render_frames("FourPlays", [1], tmp_path / "frames", resolution=(400, 400))
+
+    assert Image.open(path).size == (400, 400)
+    assert frame_widths == [8.0]
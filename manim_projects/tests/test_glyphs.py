@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+import glyphs
+
+
+class UnitGlyphs:
+    """Every glyph is a single point at its origin, one unit wide."""
+
+    def get(self, tokens):
+        return [(np.zeros((1, 3)), 1.0) for _ in tokens]
+
+
+@pytest.mark.parametrize(
+    "text, binary",
+    [
+        ("x-1", [False, True, False]),
+        ("x=-1", [False, True, False, False]),
+        ("(-x)", [False, False, False, False]),
+        ("-x", [False, False]),
+        ("f(x)+1", [False, False, False, False, True, False]),
+    ],
+)
+def test_only_binary_operators_are_spaced(monkeypatch, text, binary):
+    monkeypatch.setattr(glyphs, "glyph_cache", lambda tex_template=None: UnitGlyphs())
+    label = glyphs.GlyphText(text)
+
+    # Extra room between neighbouring glyphs beyond their width and the digit buff.
+    extra = np.diff(label.points[:, 0]) - 1.0 - 0.001 * glyphs.DEFAULT_FONT_SIZE
+    expected = [0.2 * (before + after) for before, after in zip(binary, binary[1:])]
+    assert extra == pytest.approx(expected)
@@ -0,0 +1,33 @@
+import av
+import pytest
+
+from build import load_scene_class
+from holds import enable_static_holds
+from streaming import enable_streaming
+
+
+def _render_gif(tmp_path, scene, stream=False):
+    from manim import tempconfig
+
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(tmp_path / "media"),
+        "quality": "low_quality",
+        "format": "gif",
+    }
+    with tempconfig(options):
+        instance = enable_static_holds(load_scene_class(scene)())
+        if stream:
+            enable_streaming(instance)
+        instance.render()
+        return instance.renderer.file_writer.gif_file_path
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_gif_keeps_the_length_of_holds(tmp_path, scene_module, stream):
+    gif = _render_gif(tmp_path, scene_module("FourPlays"), stream)
+
+    with av.open(str(gif)) as container:
+        frames = sum(1 for _ in container.decode(video=0))
+    # 1s create, 1s wait, 1s shift, 2s wait at 15 fps
+    assert frames == 75
@@ -0,0 +1,23 @@
+import sections
+
+
+def test_count_section_plays_draws_nothing(scene_module, count_captures):
+    found = sections.count_section_plays(scene_module("FourPlays"))
+
+    assert found == [("start", 0, 2), ("moved", 2, 4)]
+    assert count_captures["captures"] == 0
+
+
+def test_earlier_plays_are_not_drawn(monkeypatch, tmp_path, scene_module, count_captures):
+    monkeypatch.setattr(sections, "MEDIA_DIR", tmp_path / "media")
+    scene = scene_module("FourPlays")
+
+    def captures(index, name, start, end):
+        before = count_captures["captures"]
+        sections._render_range(scene, "l", index, name, start, end)
+        return count_captures["captures"] - before
+
+    # Separate indices give separate partial movie dirs, so no play comes from the cache.
+    whole = captures(2, "all", 0, 4)
+    # Without fast-forwarding, the second section would redraw the first one.
+    assert captures(0, "start", 0, 2) + captures(1, "moved", 2, 4) == whole
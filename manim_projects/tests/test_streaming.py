@@ -0,0 +1,65 @@
+import av
+import pytest
+
+from build import load_scene_class
+from holds import enable_static_holds
+from streaming import enable_streaming
+
+
+def _last_frame(path):
+    """Index of the last frame shown; holds are encoded as a gap, so frames aren't counted."""
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        return max(round(frame.pts * stream.time_base * 15) for frame in container.decode(stream))
+
+
+def _duration(path):
+    with av.open(str(path)) as container:
+        return float(container.duration / av.time_base)
+
+
+@pytest.fixture
+def render(tmp_path, scene_module):
+    """Render a scene into ``tmp_path`` the way ``render_cache.render`` does; returns its writer."""
+
+    def render(name, stream=False, **overrides):
+        from manim import tempconfig
+
+        scene = scene_module(name)
+        options = {
+            "input_file": str(scene.path),
+            "media_dir": str(tmp_path / "media"),
+            "quality": "low_quality",
+            **overrides,
+        }
+        with tempconfig(options):
+            instance = enable_static_holds(load_scene_class(scene)())
+            if stream:
+                enable_streaming(instance)
+            instance.render()
+            return instance.renderer.file_writer
+
+    return render
+
+
+def test_streamed_render_fills_the_partial_cache(render):
+    streamed = render("FourPlays", stream=True)
+    partials = streamed.partial_movie_files
+    # 1s create, 1s wait, 1s shift, 2s wait at 15 fps
+    assert [_duration(path) for path in partials] == pytest.approx([1, 1, 1, 2], abs=0.01)
+    assert _last_frame(streamed.movie_file_path) == 74
+
+    again = render("FourPlays", stream=True)
+    assert again.rendered == []
+    assert _last_frame(again.movie_file_path) == 74
+
+    unstreamed = render("FourPlays")
+    assert unstreamed.partial_movie_files == partials
+    assert _last_frame(unstreamed.movie_file_path) == 74
+
+
+def test_sound_and_sections_fall_back_to_the_partials(render):
+    writer = render("WithSound", stream=True, save_sections=True)
+    with av.open(str(writer.movie_file_path)) as container:
+        assert len(container.streams.audio) == 1
+    assert writer.sections and (writer.sections_output_dir / writer.sections[0].video).exists()
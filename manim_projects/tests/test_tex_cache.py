@@ -0,0 +1,18 @@
+import tex_cache
+from tex_cache import TexLiteral
+
+
+def test_unresolvable_templates_are_skipped(monkeypatch, tmp_path):
+    from manim import tempconfig
+
+    batches = []
+    monkeypatch.setattr(tex_cache, "typeset_batch", batches.append)
+    local = TexLiteral("MathTex", ["x"], {}, "MY_TEMPLATE", "scene.py:3")
+    library = TexLiteral("MathTex", ["y"], {}, "TexTemplateLibrary.ctex", "scene.py:4")
+    with tempconfig({"media_dir": str(tmp_path)}):
+        skipped = tex_cache._compile_literals([local, library])
+
+    assert [literal for literal, _ in skipped] == [local]
+    assert isinstance(skipped[0][1], NameError)
+    [requests] = batches
+    assert len(requests) == 1 and "}y\\special" in requests[0][0]
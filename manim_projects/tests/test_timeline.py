@@ -0,0 +1,10 @@
+import timeline
+
+
+def test_timeline_draws_nothing(monkeypatch, scene_module, count_captures):
+    monkeypatch.setattr(timeline, "find_scene", scene_module)
+    result = timeline.scene_timeline("FourPlays")
+
+    assert [play["duration"] for play in result["plays"]] == [1, 1, 1, 2]
+    assert [play["section"] for play in result["plays"]] == ["start", "start", "moved", "moved"]
+    assert count_captures["captures"] == 0
@@ -0,0 +1,423 @@
+"""Fill the ``media/Tex`` cache with fewer, larger LaTeX runs.
+
+``batch_typeset`` builds a list of ``Tex``/``MathTex`` mobjects after
+compiling all of their strings as pages of one document.
+
+Run as a script, it finds every ``Tex``/``MathTex`` call with literal
+strings in the scene modules and compiles them in a process pool before
+rendering, so scenes hit the cache instead of running ``latex`` +
+``dvisvgm`` one string at a time::
+
+    python tex_cache.py            # every module in manim_projects/
+    python tex_cache.py limit_at_infinity.py --jobs 4
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent
+MEDIA_DIR = PROJECT_DIR / "media"
+
+TEX_CLASSES = {"Tex", "MathTex", "SingleStringMathTex"}
+# Only these options change the compiled TeX; colors, font_size, scale... don't.
+COMPILE_OPTIONS = {"tex_environment", "arg_separator", "substrings_to_isolate", "tex_template"}
+
+
+class TexLiteral:
+    """One statically found ``Tex``-like call, reduced to what LaTeX sees."""
+
+    def __init__(self, cls_name, strings, options, template_source=None, location=""):
+        self.cls_name = cls_name
+        self.strings = tuple(strings)
+        self.options = dict(options)
+        self.template_source = template_source
+        self.location = location
+
+    def key(self):
+        return (
+            self.cls_name,
+            self.strings,
+            tuple(sorted((k, repr(v)) for k, v in self.options.items())),
+            self.template_source,
+        )
+
+    def __repr__(self):
+        return f"{self.cls_name}{self.strings!r} at {self.location}"
+
+
+def _literal_strings(nodes):
+    strings = []
+    for node in nodes:
+        if not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+            return None
+        strings.append(node.value)
+    return strings
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _tex_options(call):
+    options = {}
+    template_source = None
+    for keyword in call.keywords:
+        if keyword.arg == "tex_to_color_map" and isinstance(keyword.value, ast.Dict):
+            # Only the keys affect the compiled string; they are isolated like substrings.
+            keys = _literal_strings(keyword.value.keys)
+            if keys is None:
+                return None
+            options.setdefault("substrings_to_isolate", []).extend(keys)
+        elif keyword.arg == "tex_template":
+            template_source = ast.unparse(keyword.value)
+        elif keyword.arg in COMPILE_OPTIONS:
+            try:
+                value = ast.literal_eval(keyword.value)
+            except ValueError:
+                return None
+            if keyword.arg == "substrings_to_isolate":
+                options.setdefault(keyword.arg, []).extend(value)
+            else:
+                options[keyword.arg] = value
+        elif keyword.arg is None:
+            # **kwargs could carry anything
+            return None
+    return options, template_source
+
+
+def find_tex_literals(path):
+    """Return the :class:`TexLiteral` calls in one Python file."""
+    path = Path(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _call_name(node)
+        location = f"{path.name}:{node.lineno}"
+
+        if name in TEX_CLASSES:
+            strings = _literal_strings(node.args)
+            parsed = _tex_options(node)
+            if strings and parsed is not None:
+                options, template_source = parsed
+                found.append(TexLiteral(name, strings, options, template_source, location))
+
+        elif name == "batch_typeset" and len(node.args) == 2:
+            cls, items = node.args
+            parsed = _tex_options(node)
+            if (
+                isinstance(cls, ast.Name)
+                and cls.id in TEX_CLASSES
+                and isinstance(items, (ast.List, ast.Tuple))
+                and parsed is not None
+            ):
+                options, template_source = parsed
+                for item in items.elts:
+                    parts = item.elts if isinstance(item, ast.Tuple) else [item]
+                    strings = _literal_strings(parts)
+                    if strings:
+                        found.append(
+                            TexLiteral(cls.id, strings, options, template_source, location)
+                        )
+
+        elif name == "get_tex":
+            # Brace.get_tex(*tex) -> MathTex(*tex); its kwargs only position the label
+            strings = _literal_strings(node.args)
+            if strings:
+                found.append(TexLiteral("MathTex", strings, {}, location=location))
+
+        elif name == "get_axis_labels":
+            labels = {"x_label": "x", "y_label": "y"}
+            for keyword in node.keywords:
+                if keyword.arg in ("x_label", "y_label", "z_label"):
+                    value = keyword.value
+                    labels[keyword.arg] = (
+                        value.value
+                        if isinstance(value, ast.Constant) and isinstance(value.value, str)
+                        else None
+                    )
+            for label in labels.values():
+                if label:
+                    found.append(TexLiteral("MathTex", [label], {}, location=location))
+    return found
+
+
+def find_project_tex_literals(paths=None):
+    """Collect unique literals from ``paths`` (default: every module in the project)."""
+    if not paths:
+        paths = sorted(PROJECT_DIR.glob("*.py"))
+    unique = {}
+    for path in paths:
+        for literal in find_tex_literals(path):
+            unique.setdefault(literal.key(), literal)
+    return list(unique.values())
+
+
+class _Recorded(Exception):
+    pass
+
+
+@contextmanager
+def _recording_tex(requests):
+    """Make Tex mobjects record ``(expression, environment, template)`` instead of compiling."""
+    from manim import SingleStringMathTex
+
+    module = sys.modules[SingleStringMathTex.__module__]
+    original = module.tex_to_svg_file
+
+    def record(expression, environment=None, tex_template=None):
+        requests.append((expression, environment, tex_template))
+        raise _Recorded
+
+    module.tex_to_svg_file = record
+    try:
+        yield requests
+    finally:
+        module.tex_to_svg_file = original
+
+
+def _texcode(expression, environment, tex_template):
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+BATCHABLE_DOCUMENTCLASS = r"\documentclass[preview]{standalone}"
+# standalone's preview mode crops the whole document to one box; the preview
+# package on article crops each preview environment to its own page instead.
+BATCH_DOCUMENTCLASS = "\n".join([
+    r"\documentclass{article}",
+    r"\usepackage[active,tightpage]{preview}",
+    r"\setlength{\parindent}{0pt}",
+    r"\pagestyle{empty}",
+])
+
+
+def typeset_batch(requests):
+    """Compile ``(expression, environment, tex_template)`` requests into the Tex cache.
+
+    Cache misses that share a template are typeset as pages of one document
+    with a single ``latex`` and a single ``dvisvgm`` run, and each page is
+    stored under the same hashed name manim would use for the string on its
+    own.  Returns the SVG path of every request, in order.
+    """
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash, tex_to_svg_file
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+
+    svg_files = []
+    misses = {}
+    for expression, environment, tex_template in requests:
+        tex_template = tex_template or config["tex_template"]
+        code = _texcode(expression, environment, tex_template)
+        svg_file = tex_dir / (tex_hash(code) + ".svg")
+        svg_files.append(svg_file)
+        if not svg_file.exists():
+            # Strings can share a document when everything before \begin{document} matches.
+            key = (code.split(r"\begin{document}")[0], str(tex_template.tex_compiler))
+            group = misses.setdefault(key, (tex_template, {}))[1]
+            group[svg_file] = (expression, environment, code)
+
+    for tex_template, group in misses.values():
+        if len(group) == 1 or BATCHABLE_DOCUMENTCLASS not in tex_template.body:
+            for expression, environment, _ in group.values():
+                tex_to_svg_file(expression, environment, tex_template)
+        else:
+            _compile_pages(tex_template, group, tex_dir)
+    return svg_files
+
+
+def _compile_pages(tex_template, group, tex_dir):
+    from manim import config
+    from manim.utils.tex_file_writing import compile_tex, tex_hash
+
+    codes = [code for _, _, code in group.values()]
+    preamble = codes[0].split(r"\begin{document}")[0]
+    preamble = preamble.replace(BATCHABLE_DOCUMENTCLASS, BATCH_DOCUMENTCLASS)
+    pages = [
+        code.split(r"\begin{document}", 1)[1].rsplit(r"\end{document}", 1)[0]
+        for code in codes
+    ]
+    document = "\n".join([
+        preamble + r"\begin{document}",
+        *(f"\\begin{{preview}}{page}\\end{{preview}}" for page in pages),
+        r"\end{document}",
+        "",
+    ])
+    batch_tex = tex_dir / f"batch_{tex_hash(document)}.tex"
+    batch_tex.write_text(document, encoding="utf-8")
+
+    dvi_file = compile_tex(batch_tex, tex_template.tex_compiler, tex_template.output_format)
+    subprocess.run(
+        [
+            "dvisvgm",
+            *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+            "--page=1-",
+            "--no-fonts",
+            "--verbosity=0",
+            f"--output={(tex_dir / batch_tex.stem).as_posix()}-%p.svg",
+            dvi_file.as_posix(),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    page_files = sorted(
+        tex_dir.glob(f"{batch_tex.stem}-*.svg"),
+        key=lambda path: int(path.stem.rsplit("-", 1)[1]),
+    )
+    if len(page_files) != len(group):
+        raise ValueError(
+            f"dvisvgm produced {len(page_files)} pages for {len(group)} expressions"
+            f" from {batch_tex}",
+        )
+
+    for page_file, (svg_file, (_, _, code)) in zip(page_files, group.items()):
+        tex_file = svg_file.with_suffix(".tex")
+        if not tex_file.exists():
+            tex_file.write_text(code, encoding="utf-8")
+        page_file.replace(svg_file)
+    if not config["no_latex_cleanup"]:
+        for path in tex_dir.glob(f"{batch_tex.stem}.*"):
+            path.unlink()
+
+
+def batch_typeset(cls, items, **kwargs):
+    """Build ``cls(*item, **kwargs)`` for every item after one batched LaTeX run.
+
+    ``items`` holds strings, or tuples of strings for multi-part ``MathTex``.
+    The mobjects are built exactly as if constructed one by one; they just
+    find their SVGs already in the cache::
+
+        line1, line2, line3 = batch_typeset(Tex, [r"...", r"...", r"..."])
+    """
+    calls = [item if isinstance(item, tuple) else (item,) for item in items]
+    requests = []
+    with _recording_tex(requests):
+        for args in calls:
+            try:
+                cls(*args, **kwargs)
+            except _Recorded:
+                pass
+    typeset_batch(requests)
+    return [cls(*args, **kwargs) for args in calls]
+
+
+def _configure_worker(media_dir):
+    from manim import config
+
+    config.media_dir = str(media_dir)
+    # Workers share tex_dir; manim's cleanup would delete other workers' .dvi files.
+    config.no_latex_cleanup = True
+    config.verbosity = "WARNING"
+
+
+def _compile_literals(literals):
+    """Typeset ``literals`` in one batch; returns the ``(literal, error)`` pairs left out.
+
+    A literal is left out when it can't be built here, most often because
+    its ``tex_template=`` names something that only exists in its module;
+    it compiles at render time instead.
+    """
+    import manim
+
+    requests = []
+    skipped = []
+    with _recording_tex(requests):
+        for literal in literals:
+            options = dict(literal.options)
+            try:
+                if literal.template_source is not None:
+                    options["tex_template"] = eval(literal.template_source, vars(manim))
+                getattr(manim, literal.cls_name)(*literal.strings, **options)
+            except _Recorded:
+                pass
+            except Exception as error:
+                skipped.append((literal, error))
+    typeset_batch(requests)
+    return skipped
+
+
+def clean_tex_dir(tex_dir):
+    """Delete LaTeX's by-products (``.log``, ``.aux``, ``.dvi``...), keeping sources and SVGs."""
+    tex_dir = Path(tex_dir)
+    if not tex_dir.exists():
+        return
+    for path in tex_dir.iterdir():
+        if path.is_file() and path.suffix not in (".svg", ".tex"):
+            path.unlink()
+
+
+def prewarm(paths=None, jobs=None, media_dir=MEDIA_DIR):
+    """Compile every Tex literal found in ``paths`` into ``media_dir/Tex``.
+
+    Returns ``(compiled, failed, skipped)`` where ``compiled`` counts the
+    new SVGs written and ``failed`` lists ``(literal, error)`` pairs; a
+    failing batch reports every literal in it.  ``skipped`` lists the
+    literals that could not be built outside their scene, which LaTeX then
+    compiles at render time.
+    """
+    literals = find_project_tex_literals(paths)
+    tex_dir = Path(media_dir) / "Tex"
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    cached_before = set(tex_dir.glob("*.svg"))
+
+    # One batched LaTeX document per worker
+    jobs = max(1, min(jobs or os.cpu_count(), len(literals)))
+    chunks = [literals[i::jobs] for i in range(jobs)]
+
+    failed = []
+    skipped = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_configure_worker,
+        initargs=(media_dir,),
+    ) as pool:
+        futures = {pool.submit(_compile_literals, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                skipped.extend(future.result())
+            except Exception as error:
+                failed.extend((literal, error) for literal in futures[future])
+
+    clean_tex_dir(tex_dir)
+    compiled = len(set(tex_dir.glob("*.svg")) - cached_before)
+    return compiled, failed, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, help="scene modules to scan")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    parser.add_argument("--list", action="store_true", help="only list what would be compiled")
+    args = parser.parse_args()
+
+    if args.list:
+        for literal in find_project_tex_literals(args.paths):
+            print(literal)
+        return
+
+    compiled, failed, skipped = prewarm(args.paths, args.jobs, args.media_dir)
+    print(f"compiled {compiled} new Tex SVGs")
+    for literal, error in skipped:
+        print(f"skipped (compiles at render time): {literal}: {error}")
+    for literal, error in failed:
+        print(f"failed: {literal}: {error}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
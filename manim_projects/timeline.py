@@ -0,0 +1,149 @@
+"""Print a scene's play-by-play timeline without rendering a frame.
+
+``construct`` runs with every play skipped to its end state, so layout,
+``Tex`` and run times are all resolved but no frame is drawn or
+encoded.  Each play becomes one entry with its start, duration, section,
+source line and the animations and mobjects involved, which is what
+narration timing needs::
+
+    python timeline.py FunctionTendsToInfinity
+    python timeline.py LimitAtInfinity --json limit_at_infinity.timeline.json
+"""
+
+import argparse
+import json
+import linecache
+import sys
+import time
+from pathlib import Path
+
+from build import MEDIA_DIR, find_scene, load_scene_class
+
+
+def _describe(animation):
+    mobject = getattr(animation, "mobject", None)
+    return {
+        "animation": type(animation).__name__,
+        "mobject": type(mobject).__name__ if mobject is not None else None,
+        "run_time": animation.get_run_time(),
+    }
+
+
+def _call_site(filename):
+    """``(line, source)`` of the innermost frame running in ``filename``."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == filename:
+            return frame.f_lineno, linecache.getline(filename, frame.f_lineno).strip()
+        frame = frame.f_back
+    return None, None
+
+
+def skip_rasterizing(instance):
+    """Stop the plays ``instance`` skips from drawing anything.
+
+    A skipped play still caches a background of the static mobjects, runs
+    ``play_internal`` through ``renderer.render`` and, for a frozen wait,
+    redraws every mobject, none of which reaches a video.  While the
+    renderer skips, drawing, rendering and reading the frame do nothing;
+    plays it does not skip draw as usual.  The class methods still draw,
+    for callers that want a frame on purpose.
+    """
+    renderer = instance.renderer
+
+    def unless_skipping(method):
+        def wrapper(*args, **kwargs):
+            if renderer.skip_animations:
+                return None
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    renderer.update_frame = unless_skipping(renderer.update_frame)
+    renderer.render = unless_skipping(renderer.render)
+    renderer.get_frame = unless_skipping(renderer.get_frame)
+    return instance
+
+
+def scene_timeline(name):
+    """Run scene ``name`` skipping every play and return its timeline as a dict."""
+    from manim import tempconfig
+
+    scene = find_scene(name)
+    options = {
+        "input_file": str(scene.path),
+        "media_dir": str(MEDIA_DIR),
+        "dry_run": True,
+        "disable_caching": True,
+    }
+    started = time.perf_counter()
+    with tempconfig(options):
+        instance = skip_rasterizing(load_scene_class(scene)(skip_animations=True))
+        instance.skip_animation_preview = True
+        plays = []
+        section = ["start"]
+        play = instance.play
+        next_section = instance.next_section
+
+        def record_play(*args, **kwargs):
+            line, source = _call_site(str(scene.path))
+            play(*args, **kwargs)
+            start = plays[-1]["start"] + plays[-1]["duration"] if plays else 0.0
+            plays.append(
+                {
+                    "index": len(plays),
+                    "start": round(start, 6),
+                    "duration": instance.duration,
+                    "section": section[0],
+                    "line": line,
+                    "source": source,
+                    "animations": [_describe(animation) for animation in instance.animations],
+                }
+            )
+
+        def record_section(name="unnamed", *args, **kwargs):
+            section[0] = name
+            return next_section(name, *args, **kwargs)
+
+        instance.play = record_play
+        instance.next_section = record_section
+        instance.render()
+
+    total = plays[-1]["start"] + plays[-1]["duration"] if plays else 0.0
+    return {
+        "scene": scene.name,
+        "module": scene.module,
+        "duration": total,
+        "plays": plays,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def format_timeline(timeline):
+    lines = [f"{timeline['scene']}: {timeline['duration']:.2f}s in {len(timeline['plays'])} plays"]
+    for play in timeline["plays"]:
+        lines.append(
+            f"{play['start']:8.2f} +{play['duration']:6.2f}  "
+            f"{play['section']:<14} {play['line'] or '':>4}  {play['source'] or ''}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("--json", metavar="PATH", help="write the timeline here ('-' for stdout)")
+    args = parser.parse_args()
+
+    timeline = scene_timeline(args.scene)
+    if args.json == "-":
+        print(json.dumps(timeline, indent=2))
+    else:
+        if args.json:
+            Path(args.json).write_text(json.dumps(timeline, indent=2))
+        print(format_timeline(timeline))
+        print(f"computed in {timeline['elapsed']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+from manim import *
+import numpy as np
+
+_THIRDS = np.linspace(0, 1, 4)
+
+
+class TrackedLine(Line):
+    """:class:`Line` from ``start()`` to ``end()``, rewritten in place on every update.
+
+    ``start`` and ``end`` are callables, typically reading :class:`ValueTracker`
+    values, e.g. ``lambda: axes.c2p(M.get_value(), 0)``.
+    """
+
+    def __init__(self, start, end, **kwargs):
+        self.start_func = start
+        self.end_func = end
+        super().__init__(start(), end(), **kwargs)
+        self.add_updater(lambda m: m.refresh())
+
+    def refresh(self):
+        start, end = np.asarray(self.start_func()), np.asarray(self.end_func())
+        if self.points.shape != (4, 3):
+            self.points = np.empty((4, 3))
+        np.multiply.outer(_THIRDS, end - start, out=self.points)
+        self.points += start
+        return self
+
+
+def _dash_weights(num_dashes, dashed_ratio):
+    """Bezier points of ``num_dashes`` dashes as fractions along the line, like ``DashedLine``."""
+    dash = dashed_ratio / num_dashes
+    void = 1 - dashed_ratio if num_dashes == 1 else (1 - dashed_ratio) / (num_dashes - 1)
+    starts = np.arange(num_dashes) * (dash + void)
+    return (starts[:, None] + dash * _THIRDS).ravel()
+
+
+class TrackedDashedLine(VMobject):
+    """:class:`DashedLine` from ``start()`` to ``end()`` as one VMobject, rewritten in place.
+
+    The dashes are subpaths of a single point buffer, laid out exactly as
+    ``DashedLine`` would for the current length, so updating the line costs
+    one array operation instead of rebuilding a ``VGroup`` of dashes.
+    """
+
+    def __init__(
+        self,
+        start,
+        end,
+        dash_length=DEFAULT_DASH_LENGTH,
+        dashed_ratio=0.5,
+        **kwargs,
+    ):
+        self.start_func = start
+        self.end_func = end
+        self.dash_length = dash_length
+        self.dashed_ratio = dashed_ratio
+        self._weights = {}
+        self._buffer = np.empty((0, 3))
+        super().__init__(**kwargs)
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def refresh(self):
+        start, end = np.asarray(self.start_func()), np.asarray(self.end_func())
+        length = np.linalg.norm(end - start)
+        num_dashes = max(2, int(np.ceil(length / self.dash_length * self.dashed_ratio)))
+        if num_dashes not in self._weights:
+            self._weights[num_dashes] = _dash_weights(num_dashes, self.dashed_ratio)
+        weights = self._weights[num_dashes]
+
+        if len(self._buffer) < len(weights):
+            self._buffer = np.empty((len(weights), 3))
+        points = self._buffer[:len(weights)]
+        np.multiply.outer(weights, end - start, out=points)
+        points += start
+        self.points = points
+        return self
+
+    def get_start(self):
+        return np.asarray(self.start_func())
+
+    def get_end(self):
+        return np.asarray(self.end_func())
+
+
+class TrackedBrace(VMobject):
+    """:class:`Brace` under the segment ``start()`` -> ``end()``, rewritten in place.
+
+    Every point of a ``Brace`` moves affinely with its width: the curls
+    translate with the ends and the tip, the straight runs stretch.  Two
+    template braces give those coefficients once; an update is then one
+    array operation instead of re-parsing the brace's SVG path.  The brace
+    sits on the right-hand side of the direction of travel, i.e. below a
+    left-to-right segment.
+    """
+
+    def __init__(self, start, end, buff=0.2, sharpness=2, **kwargs):
+        self.start_func = start
+        self.end_func = end
+        template = Brace(Line(ORIGIN, RIGHT), buff=buff, sharpness=sharpness)
+        wider = Brace(Line(ORIGIN, 2 * RIGHT), buff=buff, sharpness=sharpness)
+        self._x_per_width = wider.points[:, 0] - template.points[:, 0]
+        self._x_at_zero = template.points[:, 0] - self._x_per_width
+        self._y = template.points[:, 1].copy()
+        # Below this width manim stops shortening the straight runs and squeezes the whole brace.
+        self._min_width = 0.90552 / sharpness
+        self._tip_point_index = template._tip_point_index
+        kwargs.setdefault("stroke_width", 0)
+        kwargs.setdefault("fill_opacity", 1.0)
+        kwargs.setdefault("background_stroke_width", 0)
+        super().__init__(**kwargs)
+        self.points = np.empty_like(template.points)
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def refresh(self):
+        start, end = np.asarray(self.start_func()), np.asarray(self.end_func())
+        along = end - start
+        width = np.linalg.norm(along)
+        x = self._x_at_zero + self._x_per_width * max(width, self._min_width)
+        if width < self._min_width:
+            x *= width / self._min_width
+        unit = along / width if width else RIGHT
+        normal = np.array([-unit[1], unit[0], 0])
+        if self.points.shape != (len(x), 3):
+            self.points = np.empty((len(x), 3))
+        np.multiply.outer(x, unit, out=self.points)
+        self.points += np.multiply.outer(self._y, normal)
+        self.points += start
+        return self
+
+    def get_tip(self):
+        return self.points[self._tip_point_index]
+
+    def get_direction(self):
+        return normalize(self.get_tip() - (self.get_start() + self.get_end()) / 2)
+
+    def get_start(self):
+        return np.asarray(self.start_func())
+
+    def get_end(self):
+        return np.asarray(self.end_func())
+
+
+def follow(mobject, point, direction=DOWN, buff=DEFAULT_MOBJECT_TO_MOBJECT_BUFFER):
+    """Keep ``mobject`` next to ``point()`` by shifting it; it is never rebuilt.
+
+    ``point`` is a callable, and so may ``direction`` be, e.g. for a label at
+    a :class:`TrackedBrace` tip: ``follow(label, brace.get_tip, brace.get_direction)``.
+    """
+
+    def place(m):
+        m.next_to(point(), direction() if callable(direction) else direction, buff=buff)
+
+    place(mobject)
+    mobject.add_updater(place)
+    return mobject
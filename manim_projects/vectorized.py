@@ -0,0 +1,283 @@
+from manim import *
+import numpy as np
+
+
+def axes_frame(axes):
+    """Return ``(origin, basis)`` for the affine map behind ``axes.c2p``."""
+    origin = np.asarray(axes.c2p(0, 0, 0), dtype=float)
+    basis = np.array([
+        np.asarray(axes.c2p(1, 0, 0), dtype=float) - origin,
+        np.asarray(axes.c2p(0, 1, 0), dtype=float) - origin,
+        np.asarray(axes.c2p(0, 0, 1), dtype=float) - origin,
+    ])
+    return origin, basis
+
+
+def apply_frame(frame, x, y, z=0):
+    origin, basis = frame
+    x, y, z = np.broadcast_arrays(
+        np.asarray(x, dtype=float),
+        np.asarray(y, dtype=float),
+        np.asarray(z, dtype=float),
+    )
+    return (
+        origin
+        + x[..., None] * basis[0]
+        + y[..., None] * basis[1]
+        + z[..., None] * basis[2]
+    )
+
+
+def batch_c2p(axes, x, y, z=0):
+    """Batched ``axes.c2p``: coordinate arrays of any shape in, ``(..., 3)`` points out.
+
+    Only valid for linearly scaled axes, which is every axes in this project.
+    """
+    return apply_frame(axes_frame(axes), x, y, z)
+
+
+def quad_bezier_points(corners):
+    """Turn ``(..., 4, 3)`` quad corners into closed jagged outlines of ``(..., 16, 3)``."""
+    start = corners
+    end = np.roll(corners, -1, axis=-2)
+    thirds = [start, start + (end - start) / 3, start + 2 * (end - start) / 3, end]
+    points = np.stack(thirds, axis=-2)
+    return points.reshape(*corners.shape[:-2], 16, 3)
+
+
+class VectorizedParametricFunction(ParametricFunction):
+    """:class:`ParametricFunction` whose ``function`` takes the whole ``t`` array.
+
+    ``function`` receives a 1D array of parameters and must return an
+    ``(N, 3)`` array of points, e.g. ``lambda t: batch_c2p(axes, t, f(t))``.
+    Points come from ``ParametricFunction(use_vectorized=True)``; the
+    ``(t values, points)`` of every continuous piece are kept in ``samples``.
+    """
+
+    def __init__(self, function, **kwargs):
+        self.vectorized_function = function
+        self.samples = []
+        super().__init__(function, use_vectorized=True, **kwargs)
+
+    def _sample_piece(self, t_values):
+        t_values, points = self.sample(np.asarray(t_values, dtype=float))
+        self.samples.append((t_values, points))
+        return points.T
+
+    def generate_points(self):
+        # ParametricFunction calls self.function once per piece with its whole t grid.
+        self.samples = []
+        function = self.function
+        self.function = self._sample_piece
+        try:
+            return super().generate_points()
+        finally:
+            self.function = function
+
+    def evaluate(self, t_values):
+        return np.asarray(self.vectorized_function(t_values), dtype=float).reshape(-1, 3)
+
+    def sample(self, t_values):
+        """``(t values, points)`` of one continuous piece, given its fixed-step ``t`` grid."""
+        return t_values, self.evaluate(t_values)
+
+    def get_subcurve(self, t1, t2, **kwargs):
+        """The part of this curve for ``t`` in ``[t1, t2]`` as a new :class:`VMobject`.
+
+        Cut from the samples taken when the curve was built, with the ends
+        interpolated between neighbouring samples; ``function`` is not called.
+        ``kwargs`` style the new curve, e.g. ``color=RED, stroke_width=6``.
+        """
+        curve = VMobject(**kwargs)
+        for t_values, points in self.samples:
+            start, end = max(t1, t_values[0]), min(t2, t_values[-1])
+            if start >= end:
+                continue
+            inside = (t_values > start) & (t_values < end)
+            ends = np.stack(
+                [np.interp([start, end], t_values, points[:, c]) for c in range(3)],
+                axis=-1,
+            )
+            curve.start_new_path(ends[0])
+            curve.add_points_as_corners(np.concatenate([points[inside], ends[1:]]))
+        if self.use_smoothing:
+            curve.make_smooth()
+        if hasattr(self, "underlying_function"):
+            curve.underlying_function = self.underlying_function
+        return curve
+
+
+def _segment_distance(q, a, b):
+    """Distance from points ``q`` to the segments ``a``-``b``, all broadcast together."""
+    ab = b - a
+    length2 = np.sum(ab * ab, axis=-1)
+    s = np.sum((q - a) * ab, axis=-1) / np.where(length2 == 0, 1, length2)
+    s = np.clip(s, 0, 1)
+    return np.linalg.norm(q - (a + s[..., None] * ab), axis=-1)
+
+
+def adaptive_samples(evaluate, t1, t2, tolerance, initial=16, max_depth=12):
+    """Sample ``evaluate`` on ``[t1, t2]`` until the polyline is within ``tolerance``.
+
+    Intervals whose midpoint is further than ``tolerance`` from their chord
+    are split, all at once per pass; then runs of points that a single chord
+    covers within ``tolerance`` are merged.  Returns ``(t values, points)``.
+    """
+    t = np.linspace(t1, t2, initial + 1)
+    points = evaluate(t)
+    for _ in range(max_depth):
+        mid = (t[:-1] + t[1:]) / 2
+        mid_points = evaluate(mid)
+        split = _segment_distance(mid_points, points[:-1], points[1:]) > tolerance
+        if not split.any():
+            break
+        at = np.nonzero(split)[0] + 1
+        t = np.insert(t, at, mid[split])
+        points = np.insert(points, at, mid_points[split], axis=0)
+
+    keep = [0]
+    start = 0
+    while start < len(t) - 1:
+        end = start + 1
+        while end + 1 < len(t) and _segment_distance(
+            points[start + 1:end + 1], points[start], points[end + 1]
+        ).max() <= tolerance:
+            end += 1
+        keep.append(end)
+        start = end
+    return t[keep], points[keep]
+
+
+def even_samples(evaluate, t, points, tolerance, max_count=4096):
+    """Resample the polyline ``(t, points)`` of ``evaluate`` at equal arc length.
+
+    ``Create`` and ``ShowPartial`` pace a curve by its number of bezier
+    curves, not by length, so a curve drawn from equally long pieces is
+    drawn at an even speed.  The count starts at the polyline's and grows
+    until every piece is within ``tolerance`` again.  Returns ``(t values,
+    points)``.
+    """
+    lengths = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=-1))])
+    if len(t) < 2 or lengths[-1] == 0:
+        return t, points
+    count = len(t) - 1
+    while True:
+        # Piece ends and midpoints in one call; the midpoints check the tolerance.
+        t_even = np.interp(np.linspace(0, lengths[-1], 2 * count + 1), lengths, t)
+        even = evaluate(t_even)
+        ends, mids = even[::2], even[1::2]
+        if count >= max_count or _segment_distance(mids, ends[:-1], ends[1:]).max() <= tolerance:
+            return t_even[::2], ends
+        count = int(np.ceil(count * 1.5))
+
+
+class AdaptiveParametricFunction(VectorizedParametricFunction):
+    """:class:`VectorizedParametricFunction` sampled by screen-space error.
+
+    Instead of a fixed ``t_step``, samples are refined where the curve bends
+    and merged where it is straight, until no sample is more than
+    ``tolerance`` pixels (at the current render resolution) off the curve.
+
+    With ``even_pacing`` (the default) those samples are then respaced to
+    equal arc length, so ``Create`` draws the graph at an even speed instead
+    of lingering where it bends.  That takes more samples than the adaptive
+    ones alone; graphs that are never drawn on can turn it off.
+    """
+
+    def __init__(
+        self,
+        function,
+        t_range=(0, 1),
+        tolerance=0.5,
+        even_pacing=True,
+        use_smoothing=False,
+        **kwargs,
+    ):
+        # Smoothing refits the handles through the sparse samples and can
+        # move the curve well past ``tolerance``, so it is off by default.
+        self.tolerance = tolerance
+        self.even_pacing = even_pacing
+        super().__init__(function, t_range=t_range, use_smoothing=use_smoothing, **kwargs)
+
+    def sample(self, t_values):
+        tolerance = self.tolerance * config.frame_width / config.pixel_width
+        t1, t2 = (self.scaling.inverse_function(t) for t in (t_values[0], t_values[-1]))
+
+        def evaluate(t):
+            return self.evaluate(self.scaling.function(t))
+
+        t_values, points = adaptive_samples(evaluate, t1, t2, tolerance)
+        if self.even_pacing:
+            t_values, points = even_samples(evaluate, t_values, points, tolerance)
+        return self.scaling.function(t_values), points
+
+
+def adaptive_plot(axes, function, x_range=None, tolerance=0.5, **kwargs):
+    """Like ``axes.plot`` for a vectorized ``function``, sampled adaptively."""
+    x_min, x_max = (x_range if x_range is not None else axes.x_range)[:2]
+    graph = AdaptiveParametricFunction(
+        lambda t: batch_c2p(axes, t, function(t)),
+        t_range=(x_min, x_max),
+        tolerance=tolerance,
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
+
+
+class VectorizedSurface(Surface):
+    """:class:`Surface` whose ``func`` takes the whole ``u, v`` grid at once.
+
+    ``func(u, v)`` receives two 2D arrays from ``np.meshgrid`` and returns the
+    matching points with a trailing axis of 3 (or an ``(N, 3)`` array).  Face
+    edges are straight between sampled vertices, as with ``should_make_jagged``.
+    """
+
+    def __init__(self, func, **kwargs):
+        self._placed = False
+        super().__init__(func, **kwargs)
+
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ maps the uv grid through func point by point right
+        # after _setup_in_uv_space; here that method already placed the faces.
+        if self._placed:
+            self._placed = False
+            return self
+        return super().apply_function(function, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        u_grid, v_grid = np.meshgrid(u_values, v_values, indexing="ij")
+        grid = np.asarray(self.func(u_grid, v_grid), dtype=float)
+        grid = grid.reshape(len(u_values), len(v_values), 3)
+
+        corners = np.stack([
+            grid[:-1, :-1],
+            grid[1:, :-1],
+            grid[1:, 1:],
+            grid[:-1, 1:],
+        ], axis=2)
+        all_points = quad_bezier_points(corners)
+
+        faces = VGroup()
+        self.list_of_faces = []
+        for i in range(len(u_values) - 1):
+            for j in range(len(v_values) - 1):
+                face = ThreeDVMobject()
+                face.set_points(all_points[i, j])
+                face.u_index = i
+                face.v_index = j
+                face.u1, face.u2 = u_values[i:i + 2]
+                face.v1, face.v2 = v_values[j:j + 2]
+                faces.add(face)
+                self.list_of_faces.append(face)
+        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        faces.set_stroke(
+            color=self.stroke_color,
+            width=self.stroke_width,
+            opacity=self.stroke_opacity,
+        )
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+        self._placed = True
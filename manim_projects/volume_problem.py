@@ -1,5 +1,7 @@
 from manim import *
 
+from tex_cache import batch_typeset
+
 class VolumeTheoremStatement(Scene):
     def construct(self):
         # Title (blue and large)
@@ -8,19 +10,30 @@ class VolumeTheoremStatement(Scene):
         # Smaller font size for the body text
         font_scale = 0.65  # You can tweak this slightly if needed
 
-        # Explanatory text (each line is scaled down)
-        line1 = Tex(r"Let $S$ be a solid that extends along the $x$-axis,").scale(font_scale).next_to(title, DOWN, buff=0.5)
-        line2 = Tex(r"bounded on the left and right by planes perpendicular").scale(font_scale).next_to(line1, DOWN, aligned_edge=LEFT)
-        line3 = Tex(r"to the $x$-axis at $x = a$ and $x = b$, respectively.").scale(font_scale).next_to(line2, DOWN, aligned_edge=LEFT)
-        line4 = Tex(r"If, for each $x \in [a, b]$, the cross-sectional area").scale(font_scale).next_to(line3, DOWN, aligned_edge=LEFT)
-        line5 = Tex(r"of $S$ perpendicular to the $x$-axis is $A(x)$,").scale(font_scale).next_to(line4, DOWN, aligned_edge=LEFT)
-        line6 = Tex(r"then the volume of the solid is").scale(font_scale).next_to(line5, DOWN, aligned_edge=LEFT)
+        # Explanatory text and the integrability condition, typeset in one LaTeX run
+        lines = batch_typeset(Tex, [
+            r"Let $S$ be a solid that extends along the $x$-axis,",
+            r"bounded on the left and right by planes perpendicular",
+            r"to the $x$-axis at $x = a$ and $x = b$, respectively.",
+            r"If, for each $x \in [a, b]$, the cross-sectional area",
+            r"of $S$ perpendicular to the $x$-axis is $A(x)$,",
+            r"then the volume of the solid is",
+            r"provided $A$ is integrable.",
+        ])
+
+        # Each line is scaled down
+        line1 = lines[0].scale(font_scale).next_to(title, DOWN, buff=0.5)
+        line2 = lines[1].scale(font_scale).next_to(line1, DOWN, aligned_edge=LEFT)
+        line3 = lines[2].scale(font_scale).next_to(line2, DOWN, aligned_edge=LEFT)
+        line4 = lines[3].scale(font_scale).next_to(line3, DOWN, aligned_edge=LEFT)
+        line5 = lines[4].scale(font_scale).next_to(line4, DOWN, aligned_edge=LEFT)
+        line6 = lines[5].scale(font_scale).next_to(line5, DOWN, aligned_edge=LEFT)
 
         # Integral formula
         volume_formula = MathTex(r"V = \int_a^b A(x)\, dx").scale(0.9).set_color(YELLOW).next_to(line6, DOWN, buff=0.5)
 
         # Integrability condition
-        condition = Tex(r"provided $A$ is integrable.").scale(font_scale).next_to(volume_formula, DOWN, buff=0.5)
+        condition = lines[6].scale(font_scale).next_to(volume_formula, DOWN, buff=0.5)
 
         # Animate
         self.play(Write(title))
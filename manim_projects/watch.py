@@ -0,0 +1,123 @@
+"""Keep manim loaded and re-render scenes whenever their modules are saved.
+
+One long-lived process imports manim once, then polls ``manim_projects/*.py``.
+When a file changes, only that module and the local modules importing it are
+reloaded, and only the scenes depending on it are re-rendered.  manim's play
+cache means unchanged plays are not re-encoded; with ``--sections`` the
+scene is rendered from the first section whose code changed to its end,
+as a standalone video::
+
+    python watch.py                        # every scene, -ql
+    python watch.py LimitAtInfinity -q m
+    python watch.py --sections
+"""
+
+import argparse
+import re
+import sys
+import time
+import traceback
+
+import build
+import render_cache
+import sections
+
+SECTION_MARK = re.compile(r"self\.next_section\(\s*[\"']([^\"']*)[\"']")
+
+
+def snapshot(project_dir=build.PROJECT_DIR):
+    return {path: path.stat().st_mtime for path in project_dir.glob("*.py")}
+
+
+def section_sources(path):
+    """``{section name: source}`` of a scene module, split at ``next_section`` calls."""
+    chunks = {"start": []}
+    current = chunks["start"]
+    for line in path.read_text(encoding="utf-8").splitlines():
+        match = SECTION_MARK.search(line)
+        if match:
+            current = chunks.setdefault(match.group(1), [])
+        current.append(line)
+    return {name: "\n".join(lines) for name, lines in chunks.items()}
+
+
+def forget_modules(changed, project_dir=build.PROJECT_DIR):
+    """Drop changed local modules, and local modules importing them, from ``sys.modules``."""
+    for path in project_dir.glob("*.py"):
+        module = sys.modules.get(path.stem)
+        if module is None or path.stem in ("watch", "build", "render_cache", "sections"):
+            continue
+        if build.local_dependencies(path) & changed:
+            del sys.modules[path.stem]
+
+
+def rerender(scene, quality, changed_sections=None):
+    """Re-render ``scene``; with ``changed_sections``, from the first of them to the end.
+
+    A change before the first ``next_section`` (imports, helpers, the
+    ``"start"`` chunk) can affect every section, so it renders in full.
+    """
+    start = time.perf_counter()
+    if changed_sections and "start" not in changed_sections:
+        rendered = sections.render_from_section(scene, changed_sections, quality)
+        if rendered is not None:
+            name, output = rendered
+            elapsed = time.perf_counter() - start
+            print(f"rendered {scene} from section {name!r} in {elapsed:.1f}s: {output}")
+            return
+    render_cache.render(scene.name, quality, no_latex_cleanup=True)
+    print(f"rendered {scene} in {time.perf_counter() - start:.1f}s")
+
+
+def watch(names=None, quality="l", by_section=False, interval=0.5):
+    import manim  # noqa: F401  (the point of the daemon: pay for this once)
+
+    mtimes = snapshot()
+    sources = {path: section_sources(path) for path in mtimes}
+    print(f"watching {build.PROJECT_DIR} (Ctrl+C to stop)")
+    while True:
+        time.sleep(interval)
+        current = snapshot()
+        changed = {path for path, mtime in current.items() if mtimes.get(path) != mtime}
+        if not changed:
+            continue
+        mtimes = current
+        forget_modules(changed)
+
+        for scene in build.find_scenes():
+            if names and scene.name not in names:
+                continue
+            if not build.local_dependencies(scene.path) & changed:
+                continue
+            changed_sections = None
+            if by_section and changed == {scene.path}:
+                new_sources = section_sources(scene.path)
+                old_sources = sources.get(scene.path, {})
+                changed_sections = {
+                    name for name, text in new_sources.items() if old_sources.get(name) != text
+                }
+            try:
+                rerender(scene, quality, changed_sections)
+            except Exception:
+                traceback.print_exc()
+        for path in changed:
+            sources[path] = section_sources(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    parser.add_argument("-q", "--quality", default="l")
+    parser.add_argument(
+        "--sections", action="store_true", help="render from the first section whose code changed"
+    )
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between polls")
+    args = parser.parse_args()
+    try:
+        watch(args.scenes, args.quality, args.sections, args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()